@@ -0,0 +1,168 @@
+import threading
+import time
+
+from panel_logging import get_logger
+
+logger = get_logger("acquisition")
+
+
+class AcquisitionThread(threading.Thread):
+    """
+    Interroge le capteur sur son propre thread et ne publie que le dernier instantané.
+
+    L'interface graphique récupère l'instantané avec poll() depuis root.after, sans
+    jamais attendre le bus I2C.
+    """
+
+    def __init__(self, source, period=1.0, conditioner=None, rate_policy=None):
+        """
+        source : objet exposant read_snapshot() (typiquement I2CInterface).
+        period : intervalle entre deux lectures, en secondes.
+        conditioner : SignalConditioner optionnel ; un instantané sans variation significative
+        n'est pas publié.
+        rate_policy : AdaptiveRatePolicy optionnelle ; elle remplace alors period.
+        """
+        super().__init__(name="acquisition", daemon=True)
+        self.source = source
+        self.period = period
+        self.conditioner = conditioner
+        self.rate_policy = rate_policy
+        self.listeners = []  # Appelés avec chaque instantané brut, sur le thread d'acquisition
+        self.publish_listeners = []  # Appelés avec chaque instantané publié (conditionné), même thread
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._wake = threading.Event()  # Interrompt l'attente entre deux lectures
+        if rate_policy is not None:
+            self.listeners.append(rate_policy.observe)
+            rate_policy.wake_event = self._wake
+        self._latest = None
+        self._published_seq = 0
+        self._taken_seq = 0
+
+        # Compteurs
+        self.frames_read = 0
+        self.read_errors = 0
+        self.frames_dropped = 0  # Instantanés remplacés avant d'avoir été affichés
+        self.stale_polls = 0  # Rafraîchissements de l'interface sans nouvel instantané
+        self.suppressed_frames = 0  # Instantanés retenus par le conditionnement
+        self.source_errors = 0  # Exceptions levées par source.read_snapshot()
+        self.listener_errors = 0  # Exceptions levées par un listener
+        self.loop_errors = 0  # Autres exceptions d'une itération (conditionnement, ...)
+        self.repeated_frames = 0  # Même instantané rendu deux fois (trame répétée) : ni listeners ni publication
+        self._last_raw = None
+
+    def run(self):
+        next_time = time.monotonic()
+        while not self._stop_event.is_set():
+            try:
+                self.acquire_once()
+            except Exception as e:
+                # Une itération en erreur ne doit jamais arrêter l'acquisition
+                self.loop_errors += 1
+                logger.exception("Erreur d'acquisition", extra={"event": "acquisition_error", "error": e})
+            if self.rate_policy is not None:
+                self.period = self.rate_policy.period
+
+            next_time += self.period
+            delay = next_time - time.monotonic()
+            if delay < 0:
+                # Le capteur a pris du retard : on repart de maintenant plutôt que d'enchaîner
+                next_time = time.monotonic()
+                delay = 0
+            if self._wake.wait(delay):
+                # Réveil (bouton pressé, arrêt) : lecture immédiate, puis au nouveau rythme
+                self._wake.clear()
+                next_time = time.monotonic()
+
+    def acquire_once(self):
+        """
+        Une lecture complète : source, listeners, conditionnement, publication.
+        Permet aussi à un autre thread (voir units.BusPoller) de piloter cette acquisition.
+        """
+        try:
+            snapshot = self.source.read_snapshot()
+        except Exception as e:
+            # Publié comme une lecture impossible : l'interface n'affiche pas l'ancien instantané
+            self.source_errors += 1
+            logger.exception("Erreur de lecture de la source", extra={"event": "source_error", "error": e})
+            snapshot = None
+        if snapshot is not None and snapshot is self._last_raw:
+            # La source a redonné son dernier instantané : ce n'est pas un nouvel échantillon
+            # (anti-rebond des alarmes, historique, flux et métriques ne le comptent pas deux fois)
+            self.repeated_frames += 1
+            return
+        self._last_raw = snapshot  # Après une lecture impossible, le suivant est republié
+        if snapshot is None:
+            self.read_errors += 1
+        else:
+            self.frames_read += 1
+        self._notify(self.listeners, snapshot)
+        self._condition_and_publish(snapshot)
+
+    def _notify(self, listeners, snapshot):
+        """Appelle chaque listener ; un listener en erreur est journalisé et compté."""
+        for listener in listeners:
+            try:
+                listener(snapshot)
+            except Exception as e:
+                self.listener_errors += 1
+                logger.exception("Erreur d'un listener d'acquisition", extra={"event": "listener_error", "error": e})
+
+    def _condition_and_publish(self, snapshot):
+        if snapshot is not None and self.conditioner is not None:
+            snapshot, changed = self.conditioner.apply(snapshot)
+            if not changed and self._latest is not None:
+                self.suppressed_frames += 1
+                return
+        self.publish(snapshot)
+
+    def publish(self, snapshot):
+        """
+        Remplace le dernier instantané publié (None signifie lecture impossible).
+        """
+        with self._lock:
+            if self._published_seq > self._taken_seq:
+                self.frames_dropped += 1
+            self._latest = snapshot
+            self._published_seq += 1
+        self._notify(self.publish_listeners, snapshot)
+
+    def poll(self):
+        """
+        Retourne (instantané, nouveau) sans bloquer.
+        nouveau vaut False si rien n'a été publié depuis l'appel précédent.
+        """
+        with self._lock:
+            if self._published_seq == self._taken_seq:
+                self.stale_polls += 1
+                return self._latest, False
+            self._taken_seq = self._published_seq
+            return self._latest, True
+
+    @property
+    def latest(self):
+        """Dernier instantané publié, sans le marquer comme affiché."""
+        with self._lock:
+            return self._latest
+
+    def stop(self):
+        """Demande l'arrêt du thread après la lecture en cours."""
+        self._stop_event.set()
+        self._wake.set()
+
+    def stats(self):
+        """Compteurs d'acquisition."""
+        return {
+            "frames_read": self.frames_read,
+            "read_errors": self.read_errors,
+            "frames_dropped": self.frames_dropped,
+            "stale_polls": self.stale_polls,
+            "suppressed_frames": self.suppressed_frames,
+            "source_errors": self.source_errors,
+            "listener_errors": self.listener_errors,
+            "loop_errors": self.loop_errors,
+            "repeated_frames": self.repeated_frames,
+            "suppressed_updates": self.conditioner.suppressed_updates if self.conditioner else 0,
+            "rate_hz": self.rate_policy.rate_hz if self.rate_policy else 1.0 / self.period if self.period else None,
+        }
@@ -0,0 +1,59 @@
+import time
+
+from sensor_snapshot import SensorSnapshot
+
+# Variation (en unités brutes) entre deux lectures considérée comme de l'activité
+DEFAULT_THRESHOLDS = {field: 2 for field in SensorSnapshot.FIELDS}
+DEFAULT_THRESHOLDS["RPM"] = 50
+
+
+class AdaptiveRatePolicy:
+    """
+    Choisit la fréquence d'échantillonnage d'après l'activité des voies.
+
+    Passe à max_hz dès qu'une voie varie de plus de son seuil ou qu'un bouton est pressé,
+    y reste pendant hold secondes, puis redescend progressivement (facteur decay par
+    lecture calme) jusqu'à min_hz.
+    """
+
+    def __init__(self, min_hz=1.0, max_hz=10.0, hold=3.0, decay=0.8, thresholds=None, clock=time.monotonic):
+        self.min_hz = min_hz
+        self.max_hz = max_hz
+        self.hold = hold
+        self.decay = decay
+        self.thresholds = DEFAULT_THRESHOLDS if thresholds is None else thresholds
+        self.clock = clock
+        self.rate_hz = min_hz  # Fréquence choisie (métrique exposée)
+        self.boosts = 0
+        self.wake_event = None  # threading.Event réveillant l'acquisition (posé par AcquisitionThread)
+        self._previous = None
+        self._last_activity = None
+
+    @property
+    def period(self):
+        return 1.0 / self.rate_hz
+
+    def boost(self, *_):
+        """
+        Activité externe (bouton pressé) : échantillonnage rapide immédiat ; l'acquisition
+        est réveillée sans attendre la fin de la période lente en cours.
+        """
+        self._activity()
+        if self.wake_event is not None:
+            self.wake_event.set()
+
+    def _activity(self):
+        self._last_activity = self.clock()
+        self.rate_hz = self.max_hz
+        self.boosts += 1
+
+    def observe(self, snapshot):
+        """Listener d'acquisition : met à jour la fréquence d'après le nouvel instantané brut."""
+        if snapshot is None:
+            return
+        previous, self._previous = self._previous, snapshot
+        if previous is not None and any(abs(getattr(snapshot, field) - getattr(previous, field)) > threshold
+                                        for field, threshold in self.thresholds.items()):
+            self._activity()  # Déjà sur le thread d'acquisition : pas de réveil
+        elif self._last_activity is None or self.clock() - self._last_activity > self.hold:
+            self.rate_hz = max(self.min_hz, self.rate_hz * self.decay)
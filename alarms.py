@@ -0,0 +1,219 @@
+import json
+import math
+import threading
+import time
+
+from panel_logging import get_logger
+from sensor_snapshot import SensorSnapshot
+
+logger = get_logger("alarms")
+
+# États d'une alarme
+NORMAL = "normal"
+ACTIVE = "active"
+LATCHED = "latched"  # Condition disparue, en attente d'acquittement
+
+
+class AlarmRule:
+    """
+    Limite d'une voie : high (au-dessus), low (en dessous), ou les deux (hors plage).
+
+    debounce : nombre d'échantillons consécutifs pour lever puis pour retomber.
+    hysteresis : marge à repasser avant de retomber (évite le battement autour du seuil).
+    latch : l'alarme reste affichée après disparition de la condition, jusqu'à acquittement.
+    """
+
+    def __init__(self, name, channel, low=None, high=None, debounce=2, hysteresis=0, latch=False, label=None):
+        if channel not in SensorSnapshot.FIELDS:
+            raise ValueError(f"Voie inconnue pour l'alarme {name} : {channel}")
+        for limit in (low, high, hysteresis):
+            if limit is not None and (isinstance(limit, bool) or not isinstance(limit, (int, float))
+                                      or not math.isfinite(limit)):
+                raise ValueError(f"Seuil non numérique ou infini pour l'alarme {name} : {limit!r}")
+        if hysteresis is None or hysteresis < 0:
+            raise ValueError(f"Hystérésis absente ou négative pour l'alarme {name} : {hysteresis!r}")
+        if low is None and high is None:
+            raise ValueError(f"L'alarme {name} n'a ni seuil bas ni seuil haut")
+        self.name = name
+        self.channel = channel
+        self.low = low
+        self.high = high
+        self.debounce = max(1, int(debounce))
+        self.hysteresis = hysteresis
+        self.latch = latch
+        self.label = label or name
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["name"], data["channel"], low=data.get("low"), high=data.get("high"),
+                   debounce=data.get("debounce", 2), hysteresis=data.get("hysteresis", 0),
+                   latch=data.get("latch", False), label=data.get("label"))
+
+
+DEFAULT_RULES = tuple(
+    [AlarmRule(f"over_voltage_s{i}", f"V{i}", high=130, hysteresis=2, label=f"Surtension S{i}") for i in (1, 2, 3)]
+    + [AlarmRule(f"over_current_s{i}", f"I{i}", high=40, hysteresis=2, latch=True, label=f"Surintensité S{i}")
+       for i in (1, 2, 3)]
+    + [
+        AlarmRule("low_fuel", "FUEL", low=10, hysteresis=2, debounce=3, label="Carburant bas"),
+        AlarmRule("low_oil", "OIL", low=10, hysteresis=2, debounce=3, label="Huile basse"),
+        AlarmRule("over_temperature", "MTEMP", high=95, hysteresis=5, latch=True, label="Surchauffe moteur"),
+        # Pas de seuil bas : moteur arrêté (RPM 0) n'est pas une alarme
+        AlarmRule("overspeed", "RPM", high=3500, hysteresis=50, debounce=3, label="Survitesse"),
+    ]
+)
+
+
+def load_rules(path):
+    """
+    Lit les règles depuis un fichier JSON :
+    [{"name": "low_fuel", "channel": "FUEL", "low": 10, "hysteresis": 2, "label": "Carburant bas"}, ...]
+    """
+    with open(path) as f:
+        return [AlarmRule.from_dict(entry) for entry in json.load(f)]
+
+
+def compile_rules(rules):
+    """
+    Compile les règles en une seule fonction evaluate(snapshot) -> tuple, un verdict par règle :
+    1 condition présente, -1 condition disparue (hystérésis comprise), 0 entre les deux.
+
+    Les voies et seuils sont validés par AlarmRule : le source généré ne contient que des
+    noms de voies et des nombres.
+    """
+    lines = []
+    for rule in rules:
+        value = f"s.{rule.channel}"
+        trip, clear = [], []
+        if rule.high is not None:
+            trip.append(f"{value} > {rule.high!r}")
+            clear.append(f"{value} <= {rule.high - rule.hysteresis!r}")
+        if rule.low is not None:
+            trip.append(f"{value} < {rule.low!r}")
+            clear.append(f"{value} >= {rule.low + rule.hysteresis!r}")
+        lines.append(f"        1 if {' or '.join(trip)} else -1 if {' and '.join(clear)} else 0,")
+    source = "def evaluate(s):\n    return (\n" + "\n".join(lines) + "\n    )\n"
+    namespace = {}
+    exec(compile(source, "<alarm rules>", "exec"), namespace)
+    return namespace["evaluate"]
+
+
+class AlarmEvent:
+    """Changement d'état d'une alarme : raised, cleared ou acknowledged."""
+    __slots__ = ("rule", "kind", "value", "timestamp")
+
+    def __init__(self, rule, kind, value, timestamp):
+        self.rule = rule
+        self.kind = kind
+        self.value = value
+        self.timestamp = timestamp
+
+    def as_dict(self):
+        return {"alarm": self.rule.name, "label": self.rule.label, "event": self.kind,
+                "channel": self.rule.channel, "value": self.value, "timestamp": self.timestamp}
+
+
+class AlarmEngine:
+    """
+    Évalue les règles compilées sur chaque instantané brut, sur le thread d'acquisition.
+
+    observe() est un listener d'AcquisitionThread : une alarme est levée au rythme de
+    l'échantillonnage, pas à celui de l'affichage. Les changements d'état sont journalisés
+    et transmis aux listeners (appelés avec un AlarmEvent, sur le thread d'acquisition).
+    """
+
+    def __init__(self, rules=DEFAULT_RULES, clock=time.time):
+        self.rules = tuple(rules)
+        self.clock = clock
+        self._evaluate = compile_rules(self.rules)
+        self.states = [NORMAL] * len(self.rules)
+        self.raised_counts = [0] * len(self.rules)
+        self.listeners = []
+        self.evaluations = 0
+        self.version = 0  # Incrémenté à chaque changement d'état (rafraîchissement de l'affichage)
+        self._trips = [0] * len(self.rules)
+        self._clears = [0] * len(self.rules)
+        self._raised_at = [0.0] * len(self.rules)
+        self._idle = True  # Aucune alarme ni aucun compteur en cours : seul un dépassement compte
+        self._lock = threading.Lock()
+
+    def observe(self, snapshot):
+        """Listener d'acquisition : appelé avec chaque instantané (ou None)."""
+        if snapshot is None:
+            return  # Capteur muet : signalé par le disjoncteur, pas par les alarmes
+        verdicts = self._evaluate(snapshot)
+        self.evaluations += 1
+        if self._idle and 1 not in verdicts:
+            return  # Cas courant : tout est dans les limites
+        events = []
+        now = self.clock()
+        with self._lock:
+            for i, verdict in enumerate(verdicts):
+                rule, state = self.rules[i], self.states[i]
+                if verdict > 0:
+                    self._clears[i] = 0
+                    if state != ACTIVE:
+                        self._trips[i] += 1
+                        if self._trips[i] >= rule.debounce:
+                            self._trips[i] = 0
+                            self.states[i] = ACTIVE
+                            self.raised_counts[i] += 1
+                            self._raised_at[i] = now
+                            events.append(AlarmEvent(rule, "raised", getattr(snapshot, rule.channel), now))
+                    continue
+                self._trips[i] = 0
+                if verdict < 0 and state == ACTIVE:
+                    self._clears[i] += 1
+                    if self._clears[i] >= rule.debounce:
+                        self._clears[i] = 0
+                        self.states[i] = LATCHED if rule.latch else NORMAL
+                        events.append(AlarmEvent(rule, "cleared", getattr(snapshot, rule.channel), now))
+                else:
+                    self._clears[i] = 0
+            self._idle = all(state == NORMAL for state in self.states) and not any(self._trips)
+            if events:
+                self.version += 1
+        self._emit(events)
+
+    def acknowledge(self, name=None):
+        """Acquitte les alarmes verrouillées (toutes, ou celle nommée) dont la condition a disparu."""
+        events = []
+        now = self.clock()
+        with self._lock:
+            for i, rule in enumerate(self.rules):
+                if self.states[i] == LATCHED and name in (None, rule.name):
+                    self.states[i] = NORMAL
+                    events.append(AlarmEvent(rule, "acknowledged", None, now))
+            self._idle = all(state == NORMAL for state in self.states) and not any(self._trips)
+            if events:
+                self.version += 1
+        self._emit(events)
+        return len(events)
+
+    def _emit(self, events):
+        for event in events:
+            extra = {"event": f"alarm_{event.kind}", "alarm": event.rule.name, "value": event.value}
+            if event.kind == "raised":
+                logger.warning(f"Alarme : {event.rule.label}", extra=extra)
+            elif event.kind == "cleared":
+                logger.info(f"Fin d'alarme : {event.rule.label}", extra=extra)
+            else:
+                logger.info(f"Alarme acquittée : {event.rule.label}", extra=extra)
+            for listener in self.listeners:
+                listener(event)
+
+    def active(self):
+        """(règle, état) des alarmes actives ou verrouillées, la plus récente en premier."""
+        with self._lock:
+            alarms = [(self._raised_at[i], rule, state)
+                      for i, (rule, state) in enumerate(zip(self.rules, self.states)) if state != NORMAL]
+        return [(rule, state) for _, rule, state in sorted(alarms, key=lambda alarm: -alarm[0])]
+
+    def summary(self):
+        """Texte court pour le panneau : alarme la plus récente, et combien d'autres."""
+        alarms = self.active()
+        if not alarms:
+            return ""
+        rule, state = alarms[0]
+        text = f"⚠ {rule.label}" + (" (acquitter)" if state == LATCHED else "")
+        return text + (f" +{len(alarms) - 1}" if len(alarms) > 1 else "")
@@ -0,0 +1,76 @@
+import hashlib
+import os
+import threading
+
+CACHE_DIR = os.environ.get("GPU_PANEL_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "gpu_panel"))
+
+
+class AssetCache:
+    """
+    Cache of pre-resized images, keyed on (path, target size, source mtime).
+
+    Resized pixels are stored on disk as PPM, which Tk loads natively: a warm start
+    neither decodes the JPEGs nor resamples them, and does not even import PIL. One
+    PhotoImage is shared per key across the process.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+        self._photos = {}
+        self._lock = threading.Lock()
+        self.disk_hits = 0
+        self.disk_misses = 0
+
+    def key(self, path, size):
+        return os.path.abspath(path), tuple(size), os.stat(path).st_mtime_ns
+
+    def cache_path(self, key):
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.ppm")
+
+    def prepare(self, path, size):
+        """
+        Make sure the resized image is on disk and return its cache file.
+        Does not touch Tk, so it can run on a background thread.
+        """
+        cached = self.cache_path(self.key(path, size))
+        if os.path.exists(cached):
+            self.disk_hits += 1
+            return cached
+
+        self.disk_misses += 1
+        from PIL import Image  # Only needed on a cache miss
+
+        img = Image.open(path).convert("RGB")
+        img = img.resize(tuple(size), Image.Resampling.LANCZOS)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp = f"{cached}.{os.getpid()}.{threading.get_ident()}.tmp"
+        img.save(tmp, format="PPM")
+        os.replace(tmp, cached)  # Atomic, concurrent writers cannot leave a torn file
+        return cached
+
+    def photo(self, path, size):
+        """Shared PhotoImage of path resized to size (must be called on the Tk thread)."""
+        key = self.key(path, size)
+        with self._lock:
+            photo = self._photos.get(key)
+        if photo is None:
+            import tkinter as tk  # The headless renderer uses prepare() without Tk
+
+            photo = tk.PhotoImage(file=self.prepare(path, size))
+            with self._lock:
+                photo = self._photos.setdefault(key, photo)
+        return photo
+
+    def discard(self, path, size):
+        """Forget the shared PhotoImage of path at size (Tk frees it once no item shows it)."""
+        with self._lock:
+            self._photos.pop(self.key(path, size), None)
+
+
+default_cache = AssetCache()
+
+
+def load_photo(path, size):
+    """Shared, cached PhotoImage of path resized to size."""
+    return default_cache.photo(path, size)
@@ -0,0 +1,217 @@
+import argparse
+import json
+import logging
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+
+from panel_logging import get_logger
+from sensor_snapshot import SensorSnapshot
+from sim_backend import SimulatedBus, SimulatedGPIO
+
+BASELINE_PATH = "benchmark_baseline.json"
+
+
+def measure(func, iterations, batches=20):
+    """
+    Call func(i) iterations times, split in batches, and return per-call timings in microseconds.
+    """
+    per_batch = max(1, iterations // batches)
+    samples = []
+    i = 0
+    for _ in range(batches):
+        start = time.perf_counter()
+        for _ in range(per_batch):
+            func(i)
+            i += 1
+        samples.append((time.perf_counter() - start) / per_batch * 1e6)
+    samples.sort()
+    return {
+        "mean_us": statistics.fmean(samples),
+        "median_us": statistics.median(samples),
+        "p95_us": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+        "calls": per_batch * batches,
+    }
+
+
+# ========================== BUS / DECODE ========================== #
+
+def bench_decode(iterations):
+    frames = [[(i + k) & 0xFF for k in range(16)] for i in range(256)]
+    return measure(lambda i: SensorSnapshot.from_block(frames[i & 0xFF]), iterations)
+
+
+def bench_read_snapshot(iterations):
+    from i2c_interface import I2CInterface
+
+    i2c = I2CInterface(bus=SimulatedBus(), gpio=SimulatedGPIO())
+    try:
+        return measure(lambda i: i2c.read_snapshot(), iterations)
+    finally:
+        i2c.scheduler.close()
+
+
+def bench_send_command(iterations):
+    from i2c_interface import I2CInterface
+
+    i2c = I2CInterface(bus=SimulatedBus(), gpio=SimulatedGPIO())
+    command = I2CInterface.COMMANDS[I2CInterface.BUTTONS["start"]]
+    try:
+        return measure(lambda i: i2c.send_command(command).result(), iterations)
+    finally:
+        i2c.scheduler.close()
+
+
+# ========================== GUI ========================== #
+
+def bench_gauges(root, iterations):
+    import tkinter as tk
+    from fuel_gauge import FuelGauge
+    from oil_gauge import OilGauge
+    from scene import Scene
+    from speed_gauge import SpeedGauge
+
+    results = {}
+    canvas = tk.Canvas(root, width=400, height=150)
+    canvas.pack()
+    scene = Scene(canvas, (400, 150))
+    gauges = {
+        "fuel_gauge_update": (FuelGauge(scene, origin=(0, 0), size=(120, 105)), 101),
+        "speed_gauge_update": (SpeedGauge(scene, origin=(140, 0), max_value=8000, min_angle=30, max_angle=180,
+                                          num_segments=5, size=(120, 105)), 8001),
+        "oil_gauge_update": (OilGauge(scene, origin=(280, 0), size=(110, 63)), 101),
+    }
+    for name, (gauge, span) in gauges.items():
+        # Changing values: the full update path, flushed to the display
+        results[name] = measure(
+            lambda i: (gauge.update_gauge((i * 37) % span), scene.flush(), root.update_idletasks()), iterations)
+    canvas.destroy()
+    return results
+
+
+def bench_tick(root, iterations):
+    """
+    Full update_display tick against the simulated bus, with changing and steady values.
+    """
+    from control_panel import ControlPanelApp
+    from i2c_interface import I2CInterface
+
+    bus = SimulatedBus()
+    panel = ControlPanelApp(root, source=I2CInterface(bus=bus, gpio=SimulatedGPIO()))
+    deadline = time.monotonic() + 30
+    while panel.acquisition is None and time.monotonic() < deadline:
+        root.update()
+    # Drive the ticks ourselves, from pre-read snapshots
+    panel.acquisition.stop()
+    panel.refresh.stop()
+    snapshots = [SensorSnapshot.from_block(bus.sensor.read_block(0, 16)) for _ in range(64)]
+    steady = snapshots[0]
+
+    def tick(snapshot):
+        panel.acquisition.publish(snapshot)
+        panel.update_display()
+        root.update_idletasks()
+
+    results = {
+        "tick_changing": measure(lambda i: tick(snapshots[i % len(snapshots)]), iterations),
+        "tick_steady": measure(lambda i: tick(steady), iterations),
+    }
+    results["tick_steady"]["tk_calls"] = panel.scene.last_frame_calls
+    return results
+
+
+def start_virtual_display():
+    """Start Xvfb when there is no display; returns the process (or None)."""
+    if os.environ.get("DISPLAY"):
+        return None
+    if not shutil.which("Xvfb"):
+        return None
+    display = ":99"
+    process = subprocess.Popen(["Xvfb", display, "-screen", "0", "1024x768x24", "-nolisten", "tcp"],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(0.5)
+    os.environ["DISPLAY"] = display
+    return process
+
+
+# ========================== RUNNER ========================== #
+
+def run(iterations, gui=True):
+    results = {
+        "decode": bench_decode(iterations * 10),
+        "read_snapshot": bench_read_snapshot(iterations),
+        "send_command": bench_send_command(iterations),
+    }
+    if not gui:
+        return results
+
+    xvfb = start_virtual_display()
+    try:
+        import tkinter as tk
+
+        root = tk.Tk()
+    except Exception as e:
+        print(f"GUI benchmarks skipped: {e}", file=sys.stderr)
+        if xvfb:
+            xvfb.terminate()
+        return results
+    try:
+        results.update(bench_gauges(root, iterations))
+        results.update(bench_tick(root, iterations))
+    finally:
+        root.destroy()
+        if xvfb:
+            xvfb.terminate()
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Return the benchmarks whose mean got slower than baseline by more than tolerance."""
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference and result["mean_us"] > reference["mean_us"] * (1 + tolerance):
+            regressions.append((name, reference["mean_us"], result["mean_us"]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bus access, gauge rendering and the refresh tick")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--no-gui", action="store_true", help="Only run the bus and decode benchmarks")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help=f"Baseline file (default: {BASELINE_PATH})")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown vs baseline (default: 0.2)")
+    args = parser.parse_args()
+    get_logger("benchmark")  # Configure the panel loggers first, then quieten them
+    logging.getLogger("gpu_panel").setLevel(logging.WARNING)  # send_command logs one line per command
+
+    results = run(args.iterations, gui=not args.no_gui)
+    report = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+    else:
+        print(report)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            f.write(report + "\n")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}, run with --save-baseline to store one.", file=sys.stderr)
+        return 0
+
+    with open(args.baseline) as f:
+        regressions = compare(results, json.load(f), args.tolerance)
+    for name, before, after in regressions:
+        print(f"REGRESSION {name}: {before:.1f}us -> {after:.1f}us", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+from collections import deque
+
+from sensor_snapshot import SensorSnapshot
+
+# Réglages par défaut : médiane glissante et/ou EMA, puis bande morte (en unités brutes).
+# Une voie absente est transmise telle quelle.
+DEFAULT_CONDITIONING = {
+    "V1": {"deadband": 1},
+    "V2": {"deadband": 1},
+    "V3": {"deadband": 1},
+    "I1": {"deadband": 1},
+    "I2": {"deadband": 1},
+    "I3": {"deadband": 1},
+    "FUEL": {"median": 5, "deadband": 1},
+    "OIL": {"median": 3, "deadband": 1},
+    "RPM": {"ema": 0.3, "deadband": 20},
+    "MTEMP": {"median": 5, "deadband": 1},
+}
+
+
+class ChannelConditioner:
+    """
+    Filtre d'une voie : médiane glissante, moyenne exponentielle (EMA), puis bande morte.
+
+    La bande morte sert d'hystérésis : la sortie ne bouge que si la valeur filtrée s'en
+    écarte de plus de deadband.
+    """
+
+    def __init__(self, median=None, ema=None, deadband=0):
+        self.window = deque(maxlen=median) if median else None
+        self.alpha = ema
+        self.deadband = deadband
+        self.average = None
+        self.output = None
+
+    def process(self, value):
+        """Retourne (valeur affichée, changée)."""
+        if self.window is not None:
+            self.window.append(value)
+            value = sorted(self.window)[len(self.window) // 2]
+        if self.alpha is not None:
+            self.average = value if self.average is None else self.average + self.alpha * (value - self.average)
+            value = round(self.average)
+        if self.output is not None and abs(value - self.output) <= self.deadband:
+            return self.output, False
+        self.output = value
+        return value, True
+
+
+class SignalConditioner:
+    """
+    Conditionnement des instantanés dans la boucle d'acquisition : seules les variations
+    significatives atteignent l'interface.
+    """
+
+    def __init__(self, config=None):
+        config = DEFAULT_CONDITIONING if config is None else config
+        self.channels = {field: ChannelConditioner(**config[field]) for field in SensorSnapshot.FIELDS
+                         if field in config}
+        self.last = None
+        self.suppressed_updates = 0  # Variations brutes retenues par un filtre ou une bande morte
+
+    def apply(self, snapshot):
+        """
+        Retourne (instantané conditionné, changé) ; changé vaut False si aucune voie affichée
+        n'a bougé depuis l'instantané précédent.
+        """
+        result = SensorSnapshot.__new__(SensorSnapshot)
+        result.timestamp = snapshot.timestamp
+        changed = self.last is None
+        for field in SensorSnapshot.FIELDS:
+            raw = getattr(snapshot, field)
+            channel = self.channels.get(field)
+            value = channel.process(raw)[0] if channel else raw
+            if self.last is not None:
+                previous = getattr(self.last, field)
+                if value != previous:
+                    changed = True
+                elif raw != previous:
+                    self.suppressed_updates += 1
+            setattr(result, field, value)
+        self.last = result
+        return result, changed
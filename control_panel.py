@@ -1,170 +1,278 @@
+import threading
+import time
 import tkinter as tk
 from tkinter import ttk
-from PIL import Image, ImageTk
 from oil_gauge import OilGauge
 from fuel_gauge import FuelGauge
 from speed_gauge import SpeedGauge
-from i2c_interface import I2CInterface
+from acquisition import AcquisitionThread
+from scene import Scene
+from refresh_scheduler import FixedRateScheduler
+from asset_cache import default_cache
+from telemetry_history import HistoryWriter, RollingLog, TelemetryHistory
+from sensor_capture import CaptureWriter
+from conditioning import SignalConditioner
+from adaptive_rate import AdaptiveRatePolicy
+from alarms import DEFAULT_RULES, AlarmEngine
+from panel_logging import get_logger
+from panel_layout import (
+    ACTION_BOX, ACTION_TEXT, AIRPLANE_X, AIRPLANE_Y, ALARM_TEXT, CONNECTION_LINES, GAUGE_BOX_OFFSET,
+    GAUGE_BOX_SIZE, GAUGE_BOX_Y, GAUGE_SIZE, GAUGE_TITLE_Y, GAUGES, GPU_POSITION, GRID_COLUMN_WIDTH, GRID_ORIGIN,
+    GRID_RECT, IMAGES, LIGHT_POSITION, LINE_DASH, OIL_ICON, OUTER_RECT, SECTIONS, SPEED_GAUGE,
+    STATUS_ROW_HEIGHT, STATUS_TEXT_OFFSET, STATUS_X, STATUS_Y, WINDOW_SIZE,
+)
+
+logger = get_logger("panel")
 
 class ControlPanelApp:
-    def __init__(self, root):
+    def __init__(self, root, refresh_rate=1.0, start_time=None, log_path=None, source=None, capture_path=None,
+                 max_rate=10.0, metrics=None, trace_path=None, stream=None, alarm_rules=None):
         self.root = root
         self.root.title("Avion Control Panel")
-        self.root.geometry("850x550")
+        self.root.geometry("{}x{}".format(*WINDOW_SIZE))
         self.root.configure(bg="white")
         self.is_on = True
 
-        self.i2c = I2CInterface()  # Initialize I2C interface
-
-        self.canvas = tk.Canvas(self.root, width=850, height=550, bg="white", highlightthickness=0)
-        self.canvas.place(x=0, y=0)
+        # Startup metrics, in seconds since start_time (process start when given by main.py)
+        self.start_time = start_time if start_time is not None else time.monotonic()
+        self.startup_metrics = {}
+
+        self.refresh_rate = refresh_rate
+        self.metrics = metrics  # Optional metrics.PanelMetrics
+        self.stream = stream  # Optional stream_server.StateBroadcaster for remote viewers
+        self.max_rate = max_rate  # Fastest adaptive polling rate; None keeps polling at refresh_rate
+        self.rate_policy = None
+        self.i2c = source  # Snapshot source; the real I2CInterface is created by _bring_up when None
+        self.capture_path = capture_path
+        self.trace_path = trace_path
+        self.tracer = None  # latency_trace.ButtonTracer when trace_path is given
+        self.acquisition = None
+        # Limits checked on every raw reading, on the acquisition thread
+        self.alarms = AlarmEngine(alarm_rules if alarm_rules is not None else DEFAULT_RULES)
+        self._shown_alarms = self.alarms.version
+        self.history = TelemetryHistory()  # Every reading, not only the displayed ones
+        self.log_path = log_path
+        self.rolling_log = None  # Opened during bring-up, so a bad --log path is shown like a hardware error
+        self.refresh = FixedRateScheduler(self.root, self.update_display, rate_hz=refresh_rate)
+
+        # The whole panel is one canvas; the scene scales it to the window and batches updates
+        self.canvas = tk.Canvas(self.root, width=WINDOW_SIZE[0], height=WINDOW_SIZE[1], bg="white",
+                                highlightthickness=0)
+        self.canvas.pack(fill="both", expand=True)
+        self.scene = Scene(self.canvas, WINDOW_SIZE)
+        self.scene.fit()
 
         # Draw grid rectangles
-        self.canvas.create_rectangle(10, 10, 840, 540, outline="black", width=2)  # Outer rectangle
-
-        # ========================== IMAGES ========================== #
-        self.gpu_image = self.load_image("images/gpu_image.jpg", (140, 100))
-        self.airplane_image = self.load_image("images/plane_not_connected.jpg", (100, 66))
-        self.airplane_image_full = self.load_image("images/plane_full.jpg", (100, 66)) 
-        self.light_on_image = self.load_image("images/light_on.jpg", (50, 50))
-        self.light_off_image = self.load_image("images/light_off.jpg", (50, 50))
+        self.scene.add("rectangle", *OUTER_RECT, outline="black", width=2)  # Outer rectangle
 
-        # ========================== WIDGETS ========================== #
-        self.on_off_image()
-        self.look_action()
-        self.create_gpu_image()
+        # ========================== SKELETON ========================== #
+        # Everything that needs neither images nor hardware paints first; image items stay empty
+        self.look_action("Initialisation...")
         self.connection_lines()
-        self.create_airplane_images()
         self.create_status_grid()
         self.create_gauges()
+        self.light_label = self.scene.add("image", *LIGHT_POSITION, anchor="nw", image=None)
+        self.create_gpu_image()
+        self.create_airplane_images()
         self.update_gauge_values(0, 0, 0)
-        self.update_display()
-
-    def load_image(self, path, size):
-        """Load and resize an image."""
+        self.scene.flush()
+        self.root.after_idle(self._first_frame)
+
+        # Hardware bring-up and asset decoding run off the Tk thread
+        self._bring_up_done = threading.Event()
+        self._bring_up_error = None
+        self._bring_up_failure = None  # (text shown on the panel, log event) of the failed step
+        threading.Thread(target=self._bring_up, name="bring-up", daemon=True).start()
+        self.root.after(20, self._finish_startup)
+
+    def _elapsed(self):
+        return time.monotonic() - self.start_time
+
+    def _first_frame(self):
+        self.root.update_idletasks()
+        self.startup_metrics["time_to_first_frame"] = self._elapsed()
+
+    def _bring_up(self):
+        """Background stage: decode/resize images into the cache and bring the hardware up."""
+        for path, size in list(IMAGES.values()) + [OIL_ICON]:
+            try:
+                default_cache.prepare(path, size)
+            except Exception as e:
+                logger.error(f"Error loading image {path}", extra={"event": "asset_error", "error": e})
+        # Any failure is shown on the panel by _finish_startup; the Tk stage must always be released
+        failure = ("Erreur matériel", "hardware_init_error")
         try:
-            img = Image.open(path)
-            img = img.resize(size, Image.Resampling.LANCZOS)
-            return ImageTk.PhotoImage(img)
+            if self.i2c is None:
+                from i2c_interface import I2CInterface  # smbus / RPi.GPIO only imported here
+
+                self.i2c = I2CInterface()  # Initialize I2C interface
+            failure = ("Erreur capture", "capture_error")
+            if self.capture_path and hasattr(self.i2c, "frame_listeners"):
+                self.i2c.frame_listeners.append(CaptureWriter(self.capture_path).write)
+            failure = ("Erreur trace", "trace_error")
+            if self.trace_path and hasattr(self.i2c, "press_listeners"):
+                from latency_trace import ButtonTracer
+
+                self.tracer = ButtonTracer(path=self.trace_path).attach(self.i2c)
+            failure = ("Erreur journal", "log_error")
+            self.rolling_log = RollingLog(self.log_path) if self.log_path else None
         except Exception as e:
-            print(f"Error loading image {path}: {e}")
-            return None
-        
+            self._bring_up_error = e
+            self._bring_up_failure = failure
+        finally:
+            self._bring_up_done.set()
+
+    def _finish_startup(self):
+        """Tk stage: once the background stage is done, place the images and start refreshing."""
+        if not self._bring_up_done.is_set():
+            self.root.after(20, self._finish_startup)
+            return
+
+        # ========================== IMAGES ========================== #
+        # Already resized in the cache: filling the empty image items is cheap
+        self.on_off_image()
+        self.scene.set(self.gpu_label, image=IMAGES["gpu_image"])
+        for airplane_label in self.airplane_labels:
+            self.scene.set(airplane_label, image=IMAGES["airplane_image"])
+        self.oil_gauge.load_icon()
+        self.scene.flush()
+        self.startup_metrics["time_to_assets"] = self._elapsed()
+
+        if self._bring_up_error is not None:
+            text, event = self._bring_up_failure
+            logger.error(f"Erreur d'initialisation : {text}", extra={"event": event, "error": self._bring_up_error})
+            self.scene.set(self.action_label, text=text, fill="red")
+            self.scene.flush()
+            return
+
+        self.scene.set(self.action_label, text="Action")
+        self.scene.flush()
+        # I2C reads off the Tk thread (a replay source paces itself)
+        period = getattr(self.i2c, "poll_period", 1.0 / self.refresh_rate)
+        if period and self.max_rate and self.max_rate > self.refresh_rate:
+            # Poll fast while channels move or after a button press, back off when steady
+            self.rate_policy = AdaptiveRatePolicy(min_hz=self.refresh_rate, max_hz=self.max_rate)
+            if hasattr(self.i2c, "button_listeners"):
+                self.i2c.button_listeners.append(self.rate_policy.boost)
+        self.acquisition = AcquisitionThread(self.i2c, period=period, conditioner=SignalConditioner(),
+                                             rate_policy=self.rate_policy)
+        # First listener: an alarm is raised within the sample that crosses its limit
+        self.acquisition.listeners.insert(0, self.alarms.observe)
+        if self.metrics is not None:
+            self.attach_metrics(self.metrics)
+        if self.stream is not None:
+            # Viewers share the published snapshots: no extra bus read per viewer
+            self.stream.online = lambda: getattr(self.i2c, "sensor_online", True)
+            self.acquisition.publish_listeners.append(self.stream.publish)
+        self.history_writer = HistoryWriter(self.history, self.rolling_log)
+        self.acquisition.listeners.append(self.history_writer.submit)
+        self.history_writer.start()
+        self.acquisition.start()
+        self.refresh.start()
+
+    def attach_metrics(self, metrics):
+        """Feed the metrics from the I2C scheduler, the device health and the acquisition thread."""
+        scheduler = getattr(self.i2c, "scheduler", None)
+        if scheduler is not None:
+            scheduler.listeners.append(metrics.observe_request)
+        if hasattr(self.i2c, "health"):
+            metrics.collect_health(self.i2c.health)
+        metrics.collect_acquisition(self.acquisition)
+        metrics.collect_alarms(self.alarms)
+        metrics.collect_startup(self.startup_metrics)
+        self.acquisition.listeners.append(metrics.observe_snapshot)
+
     def on_off_image(self):
-        if self.is_on:
-            light_state_image = tk.Label(self.root, image=self.light_on_image, bg="white")
-        else:
-            light_state_image = tk.Label(self.root, image=self.light_off_image, bg="white")
-        light_state_image.place(x=770, y=20)
+        """Show the light matching is_on (the item is reused, not recreated)."""
+        self.scene.set(self.light_label, image=IMAGES["light_on_image" if self.is_on else "light_off_image"])
 
     def look_action(self, action="Action"):
-        canvas = tk.Canvas(self.root, width=250, height=50, bg="white", highlightthickness=0)
-        canvas.place(x=15, y=15)
-
+        x, y, width, height = ACTION_BOX
         # Draw grid rectangles
-        canvas.create_rectangle(0, 0, 250, 50, outline="black", width=2)  # Outer rectangle
-
-        title_label = tk.Label(canvas, text=action, font=("Poppins", 12, "bold"), bg="white")
-        title_label.place(x=10, y=10)
+        self.scene.add("rectangle", x, y, x + width, y + height, outline="black", width=2)  # Outer rectangle
+        self.action_label = self.scene.add("text", x + ACTION_TEXT[0], y + ACTION_TEXT[1], text=action,
+                                           font=("Poppins", 12, "bold"), fill="black", anchor="nw")
+        # Active alarm under the action text; clicking it acknowledges the latched ones
+        self.alarm_label = self.scene.add("text", x + ALARM_TEXT[0], y + ALARM_TEXT[1], text="",
+                                          font=("Poppins", 9, "bold"), fill="red", anchor="nw")
+        self.canvas.tag_bind(self.alarm_label.item, "<Button-1>", lambda event: self.acknowledge_alarms())
+
+    def acknowledge_alarms(self):
+        if self.alarms.acknowledge():
+            self.scene.set(self.alarm_label, text=self.alarms.summary())
+            self.scene.flush()
 
     def create_gpu_image(self):
-        """Place the GPU image at the top-center."""
-        if self.gpu_image:
-            gpu_label = tk.Label(self.root, image=self.gpu_image, bg="white")
-            gpu_label.place(x=350, y=40)
+        """Place the GPU image at the top-center (empty until the images are loaded)."""
+        self.gpu_label = self.scene.add("image", *GPU_POSITION, anchor="nw", image=None)
 
     def connection_lines(self):
         self.connection_lines = {
-            "line1": self.canvas.create_line(400, 90, 150, 90, fill="black", width=2, dash=(5, 2)),
-            "line2": self.canvas.create_line(150, 90, 150, 220, fill="black", width=2, dash=(5, 2)),
-            "line3": self.canvas.create_line(330, 90, 330, 220, fill="black", width=2, dash=(5, 2)),
-            "line4": self.canvas.create_line(520, 90, 520, 220, fill="black", width=2, dash=(5, 2)),
-            "line5": self.canvas.create_line(400, 90, 671, 90, fill="black", width=2, dash=(5, 2)),
-            "line6": self.canvas.create_line(670, 90, 670, 220, fill="black", width=2, dash=(5, 2))
+            name: self.scene.add("line", *coords, fill="black", width=2, dash=LINE_DASH)
+            for name, coords in CONNECTION_LINES.items()
         }
 
     def create_airplane_images(self):
-        """Place 4 airplane images in a row."""
-        positions = [100, 270, 460, 610]
-        for pos in positions:
-            if self.airplane_image:
-                airplane_label = tk.Label(self.root, image=self.airplane_image, bg="white")
-                airplane_label.place(x=pos, y=180)
-                if pos == 100:
-                    self.airplane_label1 = airplane_label
-                if pos == 270:
-                    self.airplane_label2 = airplane_label
-                if pos == 460:
-                    self.airplane_label3 = airplane_label
-                if pos == 610:
-                    self.airplane_label4 = airplane_label
+        """Place 4 airplane images in a row (empty until the images are loaded)."""
+        self.airplane_labels = [self.scene.add("image", pos, AIRPLANE_Y, anchor="nw", image=None)
+                                for pos in AIRPLANE_X]
 
     def create_status_grid(self):
         """Create the grid displaying ON/OFF statuses."""
-        labels = ["S1", "S2", "S3", "S4"]
-        x_positions = [100, 260, 430, 610]
-        y_position = 270
+        y_position = STATUS_Y
 
         self.draw_grid_lines()
-        for i, pos in enumerate(x_positions):
+        self.status_labels = []
+        self.current_labels = []
+        for (sensor_id, _), pos in zip(SECTIONS, STATUS_X):
+            x = pos + STATUS_TEXT_OFFSET
             # Top row - Section labels
-            section_label = tk.Label(self.root, text=labels[i], font=("Poppins", 12, "bold"), bg="white")
-            section_label.place(x=pos+50, y=y_position)
+            self.scene.add("text", x, y_position, text=sensor_id, font=("Poppins", 12, "bold"), anchor="nw")
 
             # Middle row - Status OFF
-            status_label = tk.Label(self.root, text="OFF", fg="red", font=("Poppins", 12), bg="white")
-            status_label.place(x=pos+50, y=y_position+40)
+            status_label = self.scene.add("text", x, y_position + STATUS_ROW_HEIGHT, text="OFF", fill="red",
+                                          font=("Poppins", 12), anchor="nw")
 
             # Bottom row - Placeholder ("-")
-            placeholder_label = tk.Label(self.root, text="-", font=("Poppins", 12), bg="white")
-            placeholder_label.place(x=pos+50, y=y_position+80)
-            if i==0:
-                self.s1_status_label = status_label
-                self.s1_current_label = placeholder_label
-            elif i==1:
-                self.s2_status_label = status_label
-                self.s2_current_label = placeholder_label
-            elif i==2:
-                self.s3_status_label = status_label
-                self.s3_current_label = placeholder_label
-            elif i==3:
-                self.s4_status_label = status_label
-                self.s4_current_label = placeholder_label
-
-        # Draw grid lines
-        #self.draw_grid_lines()
+            placeholder_label = self.scene.add("text", x, y_position + 2 * STATUS_ROW_HEIGHT, text="-",
+                                               fill="black", font=("Poppins", 12), anchor="nw")
+            self.status_labels.append(status_label)
+            self.current_labels.append(placeholder_label)
 
     def draw_grid_lines(self):
         """Draw grid lines for the status table."""
-        canvas = tk.Canvas(self.root, width=820, height=150, bg="white", highlightthickness=0)
-        canvas.place(x=15, y=260)
+        ox, oy = GRID_ORIGIN
+        left, top, right, bottom = ox + GRID_RECT[0], oy + GRID_RECT[1], ox + GRID_RECT[2], oy + GRID_RECT[3]
 
         # Draw grid rectangles
-        canvas.create_rectangle(55, 0, 750, 120, outline="black", width=2)  # Outer rectangle
-        for i in range(1, 4):
-            canvas.create_line(55 + i * 170, 0, 55 + i * 170, 120, fill="black", width=2)  # Vertical lines
-        canvas.create_line(55, 40, 750, 40, fill="black", width=2)  # First horizontal line
-        canvas.create_line(55, 80, 750, 80, fill="black", width=2)  # Second horizontal line
+        self.scene.add("rectangle", left, top, right, bottom, outline="black", width=2)  # Outer rectangle
+        for i in range(1, len(SECTIONS)):
+            x = left + i * GRID_COLUMN_WIDTH
+            self.scene.add("line", x, top, x, bottom, fill="black", width=2)  # Vertical lines
+        for row in (1, 2):  # Horizontal lines
+            y = top + row * STATUS_ROW_HEIGHT
+            self.scene.add("line", left, y, right, y, fill="black", width=2)
 
     def create_gauges(self):
         """Create empty boxes for Fuel, Oil, and Speed gauges."""
-        titles = ["Fuel", "Oil", "Speed"]
-        x_positions = [120, 350, 580]
-
-        for i, title in enumerate(titles):
+        for i, (title, x_position) in enumerate(GAUGES):
             # Title label
-            title_label = tk.Label(self.root, text=title, font=("Poppins", 12, "bold"), bg="white")
-            title_label.place(x=x_positions[i]-(len(title))*9, y=450)
+            self.scene.add("text", x_position-(len(title))*9, GAUGE_TITLE_Y, text=title,
+                           font=("Poppins", 12, "bold"), anchor="nw")
 
             # Box outline
-            canvas = tk.Canvas(self.root, width=120, height=100, bg="white", highlightthickness=2, highlightbackground="black")
+            box_x = x_position + GAUGE_BOX_OFFSET
+            self.scene.add("rectangle", box_x - 2, GAUGE_BOX_Y - 2, box_x + GAUGE_BOX_SIZE[0] + 1,
+                           GAUGE_BOX_Y + GAUGE_BOX_SIZE[1] + 1, outline="black", width=2)
             if i==0:
-                self.fuel_gauge = FuelGauge(canvas, size=(120, 105))
+                self.fuel_gauge = FuelGauge(self.scene, origin=(box_x, GAUGE_BOX_Y), size=GAUGE_SIZE)
             if i==1:
-                self.oil_gauge = OilGauge(canvas, size=(110, 63))
+                origin = (box_x + (GAUGE_BOX_SIZE[0] - OIL_ICON[1][0]) // 2, GAUGE_BOX_Y)
+                self.oil_gauge = OilGauge(self.scene, origin=origin, icon_path=OIL_ICON[0], size=OIL_ICON[1],
+                                          defer_icon=True)
             if i==2:
-                self.speed_gauge = SpeedGauge(canvas, max_value=8000, min_angle=30, max_angle=180, num_segments=5, size=(120, 105))
-            canvas.place(x=x_positions[i]+15, y=390)
+                self.speed_gauge = SpeedGauge(self.scene, origin=(box_x, GAUGE_BOX_Y), size=GAUGE_SIZE,
+                                              **SPEED_GAUGE)
     
 
     
@@ -180,51 +288,57 @@ class ControlPanelApp:
         """Met à jour la jauge d'huile."""
         self.oil_gauge.update_gauge(value)
 
-    def update_connection_line(self, active):
+    def update_connection_line(self, names, active):
         """Met à jour les lignes de connexion."""
-        style = {"dash": () if active else (5, 2), "fill": "blue" if active else "black"}
-        self.canvas.itemconfig(self.connection_lines["line1"], **style)
-        self.canvas.itemconfig(self.connection_lines["line2"], **style)
+        style = {"dash": () if active else LINE_DASH, "fill": "blue" if active else "black"}
+        for name in names:
+            self.scene.set(self.connection_lines[name], **style)
 
     def update_gauge_values(self, fuel, oil, speed):
         """Met à jour toutes les jauges avec de nouvelles valeurs."""
         self.update_fuel_gauge(fuel)
         self.update_oil_gauge(oil)
         self.update_speed_gauge(speed)
-        
+
     def update_voltage_label(self, label, voltage):
         if voltage is not None:
-            label.config(text=f"{voltage}V", fg="black")
+            self.scene.set(label, text=f"{voltage}V", fill="black")
         else:
-            label.config(text="OFF", fg="red")
+            self.scene.set(label, text="OFF", fill="red")
 
     def update_current_label(self, label, current):
         if current is not None:
-            label.config(text=f"{current}A", fg="black")
+            self.scene.set(label, text=f"{current}A", fill="black")
         else:
-            label.config(text="-", fg="black")
+            self.scene.set(label, text="-", fill="black")
     def update_display(self):
-        # Get values from the I2C interface
-        if self.is_on:
-            s1_voltage = self.i2c.get_voltage("S1")
-            s2_voltage = self.i2c.get_voltage("S2")
-            s3_voltage = self.i2c.get_voltage("S3")
-            
-            s1_current = self.i2c.get_current("S1")
-            s2_current = self.i2c.get_current("S2")
-            s3_current = self.i2c.get_current("S3")
-            
-            gauges_values = self.i2c.get_gauges_values()
-            battery_full = self.i2c.is_battery_full()
-
-            
+        start = time.perf_counter()
+        tk_calls = self.render_frame() or 0
+        if self.metrics is not None:
+            self.metrics.observe_frame(time.perf_counter() - start, tk_calls)
+
+    def render_frame(self):
+        """Render the latest snapshot; returns the number of Tk calls made."""
+        # Latest snapshot published by the acquisition thread (never blocks on I2C)
+        snapshot, fresh = self.acquisition.poll()
+        if self.rate_policy is not None:
+            # The display follows the sampling rate, never slower than the configured refresh rate
+            self.refresh.set_rate(max(self.refresh_rate, self.rate_policy.rate_hz))
+        if not fresh and self.alarms.version == self._shown_alarms:
+            # Nothing new since the last refresh: the widgets are already up to date
+            return
+        if not self.is_on:
+            snapshot = None
+            self.refresh.stop()
+        if snapshot and "time_to_first_reading" not in self.startup_metrics:
+            self.startup_metrics["time_to_first_reading"] = self._elapsed()
+            logger.info(f"Démarrage : premier affichage {self.startup_metrics.get('time_to_first_frame', 0):.3f}s, "
+                        f"première lecture {self.startup_metrics['time_to_first_reading']:.3f}s",
+                        extra={"event": "startup"})
+        if snapshot:
+            gauges_values = snapshot.gauges()
+            battery_full = snapshot.is_battery_full()
         else:
-            s1_voltage = None
-            s2_voltage = None
-            s3_voltage = None
-            s1_current = None
-            s2_current = None
-            s3_current = None
             battery_full = False
             gauges_values = {
             "fuel":0,
@@ -232,43 +346,33 @@ class ControlPanelApp:
             "rpm":0
             }
             
+        self.scene.begin_frame()
+        # A tripped circuit breaker is shown without touching the bus
+        if getattr(self.i2c, "sensor_online", True):
+            self.scene.set(self.action_label, text="Action", fill="black")
+        else:
+            self.scene.set(self.action_label, text="Capteur hors ligne", fill="red")
+        self._shown_alarms = self.alarms.version
+        self.scene.set(self.alarm_label, text=self.alarms.summary())
         self.update_gauge_values(gauges_values["fuel"], gauges_values["oil"], gauges_values["rpm"])
-        # Update voltage labels
-        self.update_voltage_label(self.s1_status_label, s1_voltage)
-        self.update_voltage_label(self.s2_status_label, s2_voltage)
-        self.update_voltage_label(self.s3_status_label, s3_voltage)
-
-        # Update current labels
-        self.update_current_label(self.s1_current_label, s1_current)
-        self.update_current_label(self.s2_current_label, s2_current)
-        self.update_current_label(self.s3_current_label, s3_current)
+
+        # Update voltage and current labels, and the connection lines to the airplanes
+        for (sensor_id, lines), status_label, current_label in zip(SECTIONS, self.status_labels, self.current_labels):
+            if not lines:
+                continue  # No sensor channel behind this section
+            voltage = snapshot.voltage(sensor_id) if snapshot else None
+            current = snapshot.current(sensor_id) if snapshot else None
+            self.update_voltage_label(status_label, voltage)
+            self.update_current_label(current_label, current)
+            self.update_connection_line(lines, bool(current))
         
         # Update airplane image based on battery status
         if battery_full:
-            self.airplane_label1.config(image=self.airplane_image_full)
-        else:
-            self.airplane_label1.config(image=self.airplane_image)
-
-        # Update the connection line to the airplane
-        if s1_current:
-            self.canvas.itemconfig(self.connection_lines["line1"], dash=(), fill="blue")
-            self.canvas.itemconfig(self.connection_lines["line2"], dash=(), fill="blue")
-        else:
-            self.canvas.itemconfig(self.connection_lines["line1"], dash=(5, 2), fill="black")
-            self.canvas.itemconfig(self.connection_lines["line2"], dash=(5, 2), fill="black")
-        if s2_current:
-            self.canvas.itemconfig(self.connection_lines["line3"], dash=(), fill="blue")
+            self.scene.set(self.airplane_labels[0], image=IMAGES["airplane_image_full"])
         else:
-            self.canvas.itemconfig(self.connection_lines["line3"], dash=(5, 2), fill="black")
-        if s3_current:
-            self.canvas.itemconfig(self.connection_lines["line4"], dash=(), fill="blue")
-            self.canvas.itemconfig(self.connection_lines["line5"], dash=(), fill="blue")
-        else:
-            self.canvas.itemconfig(self.connection_lines["line4"], dash=(5, 2), fill="black")
-            self.canvas.itemconfig(self.connection_lines["line5"], dash=(5, 2), fill="black")
-
-        if self.is_on:
-            self.root.after(1000, self.update_display)
+            self.scene.set(self.airplane_labels[0], image=IMAGES["airplane_image"])
+        # Every change of the frame reaches Tk here, in one batch
+        return self.scene.end_frame()
 
 if __name__ == "__main__":
     root = tk.Tk()
@@ -0,0 +1,86 @@
+import threading
+import time
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Disjoncteur d'un périphérique I2C.
+
+    Après failure_threshold échecs consécutifs, le périphérique est considéré hors ligne
+    et plus aucune lecture n'est tentée pendant backoff secondes. Une seule lecture de
+    test (semi-ouvert) est alors autorisée : réussie, le disjoncteur se referme ; ratée,
+    le délai double, jusqu'à max_backoff.
+    """
+
+    def __init__(self, failure_threshold=3, base_backoff=0.5, max_backoff=30.0, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.clock = clock
+        self.state = CLOSED
+        self.failures = 0
+        self.backoff = base_backoff
+        self.open_until = 0.0
+        self.rejected = 0  # Transactions évitées pendant que le disjoncteur était ouvert
+        self.probes = 0  # Lectures de test (nouvelles tentatives) en semi-ouvert
+        self._lock = threading.Lock()
+
+    @property
+    def online(self):
+        return self.state != OPEN
+
+    def allow(self):
+        """Indique si une transaction peut être tentée maintenant."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and self.clock() >= self.open_until:
+                self.state = HALF_OPEN  # Lecture de test
+                self.probes += 1
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        """Retourne l'état précédent (pour journaliser un retour en ligne)."""
+        with self._lock:
+            previous = self.state
+            self.state = CLOSED
+            self.failures = 0
+            self.backoff = self.base_backoff
+            return previous
+
+    def record_failure(self):
+        """Retourne True si le disjoncteur vient de s'ouvrir."""
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN:
+                self.backoff = min(self.backoff * 2, self.max_backoff)
+            elif self.failures < self.failure_threshold:
+                return False
+            opened = self.state == CLOSED
+            self.state = OPEN
+            self.open_until = self.clock() + self.backoff
+            return opened
+
+
+class DeviceHealth:
+    """
+    Un disjoncteur par adresse I2C, créé à la demande.
+    """
+
+    def __init__(self, **breaker_options):
+        self.breaker_options = breaker_options
+        self.breakers = {}
+
+    def breaker(self, address):
+        if address not in self.breakers:
+            self.breakers[address] = CircuitBreaker(**self.breaker_options)
+        return self.breakers[address]
+
+    def is_online(self, address):
+        return self.breaker(address).online
@@ -0,0 +1,181 @@
+import time
+
+START_TIME = time.monotonic()
+
+import argparse
+import os
+import signal
+import sys
+import threading
+
+from acquisition import AcquisitionThread
+from adaptive_rate import AdaptiveRatePolicy
+from alarms import DEFAULT_RULES, AlarmEngine, load_rules
+from conditioning import SignalConditioner
+from panel_logging import get_logger
+from sensor_capture import CaptureWriter
+from telemetry_history import HistoryWriter, RollingLog, TelemetryHistory
+
+SNAPSHOT_PATH = "panel.png"
+
+logger = get_logger("headless")
+
+
+class HeadlessPanel:
+    """
+    Acquisition, conditioning and logging without the Tk panel, for units with no display.
+
+    The panel can still be rendered to a PNG on demand (SIGUSR1, or render()), with the
+    same layout as the Tk panel; PIL is only imported then.
+    """
+
+    def __init__(self, source=None, refresh_rate=1.0, max_rate=10.0, log_path=None, capture_path=None,
+                 metrics=None, snapshot_path=SNAPSHOT_PATH, stream=None, alarm_rules=None):
+        if source is None:
+            from i2c_interface import I2CInterface
+
+            source = I2CInterface()
+        self.i2c = source
+        self.snapshot_path = snapshot_path
+        self.metrics = metrics
+        self.history = TelemetryHistory()
+        self.renderer = None
+        self.renders = 0
+        self._running = False
+        self._render_requested = threading.Event()
+        self._stop_event = threading.Event()
+
+        if capture_path and hasattr(source, "frame_listeners"):
+            source.frame_listeners.append(CaptureWriter(capture_path).write)
+
+        period = getattr(source, "poll_period", 1.0 / refresh_rate)
+        self.rate_policy = None
+        if period and max_rate and max_rate > refresh_rate:
+            self.rate_policy = AdaptiveRatePolicy(min_hz=refresh_rate, max_hz=max_rate)
+            if hasattr(source, "button_listeners"):
+                source.button_listeners.append(self.rate_policy.boost)
+        self.acquisition = AcquisitionThread(source, period=period, conditioner=SignalConditioner(),
+                                             rate_policy=self.rate_policy)
+        # Limits checked on every raw reading; events go to the log
+        self.alarms = AlarmEngine(alarm_rules if alarm_rules is not None else DEFAULT_RULES)
+        self.acquisition.listeners.insert(0, self.alarms.observe)
+        if metrics is not None:
+            if getattr(source, "scheduler", None) is not None:
+                source.scheduler.listeners.append(metrics.observe_request)
+            if hasattr(source, "health"):
+                metrics.collect_health(source.health)
+            metrics.collect_acquisition(self.acquisition)
+            metrics.collect_alarms(self.alarms)
+            self.acquisition.listeners.append(metrics.observe_snapshot)
+        if stream is not None:
+            stream.online = lambda: getattr(source, "sensor_online", True)
+            self.acquisition.publish_listeners.append(stream.publish)
+        self.history_writer = HistoryWriter(self.history, RollingLog(log_path) if log_path else None)
+        self.acquisition.listeners.append(self.history_writer.submit)
+
+    def request_render(self, *_):
+        """Signal handler: render on the main loop, never inside the handler."""
+        self._render_requested.set()
+        self._stop_event.set()  # Wakes the main loop up
+
+    def stop(self, *_):
+        self._running = False
+        self._stop_event.set()
+
+    def render(self, path=None):
+        """Render the latest conditioned snapshot to a PNG and return its path."""
+        if self.renderer is None:
+            from panel_render import PanelRenderer  # PIL only when a snapshot is asked for
+
+            self.renderer = PanelRenderer()
+        snapshot = self.acquisition.latest
+        path = path or self.snapshot_path
+        tmp = f"{path}.tmp"
+        self.renderer.save(tmp, snapshot, online=getattr(self.i2c, "sensor_online", True),
+                           alarm=self.alarms.summary())
+        os.replace(tmp, path)  # A reader never sees a half-written PNG
+        self.renders += 1
+        return path
+
+    def run(self, duration=None, snapshot_interval=None):
+        """Acquire until SIGINT/SIGTERM (or duration seconds); optionally render every snapshot_interval."""
+        self._running = True
+        self.history_writer.start()
+        self.acquisition.start()
+        deadline = time.monotonic() + duration if duration else None
+        next_render = time.monotonic() + snapshot_interval if snapshot_interval else None
+        try:
+            while self._running:
+                timeouts = [t - time.monotonic() for t in (deadline, next_render) if t is not None]
+                self._stop_event.wait(max(0.0, min(timeouts)) if timeouts else None)
+                self._stop_event.clear()
+                now = time.monotonic()
+                if deadline is not None and now >= deadline:
+                    break
+                if next_render is not None and now >= next_render:
+                    next_render = now + snapshot_interval
+                    self._render_requested.set()
+                if self._render_requested.is_set():
+                    self._render_requested.clear()
+                    try:
+                        path = self.render()
+                    except Exception as e:
+                        logger.exception("Erreur de rendu du panneau", extra={"event": "render_error", "error": e})
+                    else:
+                        logger.info(f"Instantané du panneau : {path}", extra={"event": "snapshot_rendered"})
+        finally:
+            self.acquisition.stop()
+            self.history_writer.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Avion GPU acquisition and logging without a display")
+    parser.add_argument("--rate", type=float, default=1.0, help="Base polling rate in Hz (default: 1)")
+    parser.add_argument("--max-rate", type=float, default=10.0,
+                        help="Fastest adaptive polling rate in Hz while channels change (default: 10)")
+    parser.add_argument("--log", metavar="PATH", help="Rolling telemetry log file (memory-mapped, fixed records)")
+    parser.add_argument("--capture", metavar="PATH", help="Record raw sensor frames for replay.py")
+    parser.add_argument("--simulate", action="store_true", help="Use the simulated SMBus/GPIO backend")
+    parser.add_argument("--metrics-port", type=int, help="Serve Prometheus metrics on this port (/metrics)")
+    parser.add_argument("--stream-port", type=int,
+                        help="Stream live panel state to remote viewers on this port (SSE, /events)")
+    parser.add_argument("--snapshot", metavar="PATH", default=SNAPSHOT_PATH,
+                        help=f"PNG written on SIGUSR1 (default: {SNAPSHOT_PATH})")
+    parser.add_argument("--snapshot-interval", type=float, help="Also render the PNG every N seconds")
+    parser.add_argument("--duration", type=float, help="Stop after N seconds")
+    parser.add_argument("--alarms", metavar="PATH", help="Alarm rules (JSON) instead of the default limits")
+    args = parser.parse_args()
+
+    metrics = None
+    if args.metrics_port:
+        from metrics import MetricsServer, PanelMetrics
+
+        metrics = PanelMetrics()
+        MetricsServer(metrics.registry, port=args.metrics_port).start()
+    stream = None
+    if args.stream_port:
+        from stream_server import StateBroadcaster, StreamServer
+
+        stream = StateBroadcaster()
+        StreamServer(stream, port=args.stream_port).start()
+    source = None
+    if args.simulate:
+        from i2c_interface import I2CInterface
+        from sim_backend import SimulatedBus, SimulatedGPIO
+
+        source = I2CInterface(bus=SimulatedBus(), gpio=SimulatedGPIO())
+
+    panel = HeadlessPanel(source=source, refresh_rate=args.rate, max_rate=args.max_rate, log_path=args.log,
+                          capture_path=args.capture, metrics=metrics, snapshot_path=args.snapshot,
+                          stream=stream, alarm_rules=load_rules(args.alarms) if args.alarms else None)
+    signal.signal(signal.SIGUSR1, panel.request_render)
+    signal.signal(signal.SIGTERM, panel.stop)
+    signal.signal(signal.SIGINT, panel.stop)
+    logger.info(f"Acquisition sans affichage démarrée en {time.monotonic() - START_TIME:.3f}s "
+                f"(pid {os.getpid()}, SIGUSR1 : instantané {args.snapshot})", extra={"event": "startup"})
+    panel.run(duration=args.duration, snapshot_interval=args.snapshot_interval)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
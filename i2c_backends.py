@@ -0,0 +1,16 @@
+def open_smbus(bus_number=1):
+    """
+    Ouvre le bus SMBus matériel (Raspberry Pi).
+    """
+    import smbus  # Nécessite que ce module soit installé pour votre système (Raspberry Pi typiquement)
+
+    return smbus.SMBus(bus_number)
+
+
+def load_gpio():
+    """
+    Retourne le module RPi.GPIO.
+    """
+    import RPi.GPIO as GPIO  # Nécessite la bibliothèque RPi.GPIO
+
+    return GPIO
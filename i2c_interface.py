@@ -1,5 +1,13 @@
-import smbus  # Nécessite que ce module soit installé pour votre système (Raspberry Pi typiquement)
-import RPi.GPIO as GPIO  # Nécessite la bibliothèque RPi.GPIO
+import time
+from concurrent.futures import Future
+
+from device_health import DeviceHealth
+from i2c_backends import load_gpio, open_smbus
+from panel_logging import get_logger
+from sensor_snapshot import FrameDecoder, FrameError, RepeatedFrameError
+from i2c_scheduler import I2CScheduler, PRIORITY_COMMAND, PRIORITY_EMERGENCY
+
+logger = get_logger("i2c")
 
 class I2CInterface:
     """
@@ -32,146 +40,228 @@ class I2CInterface:
         11: [0x16, 0x17, 0x18]
     }
 
-    def __init__(self):
+    def __init__(self, bus=None, gpio=None, bus_number=1, verify_checksum=False, check_sequence=False):
         """
         Initialise les connexions GPIO et I2C.
+        bus et gpio permettent d'injecter un autre backend (voir sim_backend) ; par défaut
+        le bus SMBus bus_number et RPi.GPIO sont utilisés.
+        verify_checksum et check_sequence activent le contrôle d'intégrité des trames,
+        si le firmware du capteur remplit les octets 11 et 15.
         """
+        # Dernier instantané capteur lu
+        self.snapshot = None
+        self.decoder = FrameDecoder(verify_checksum=verify_checksum, check_sequence=check_sequence)
+        # Appelés avec chaque bloc brut lu sur le capteur (enregistrement de captures)
+        self.frame_listeners = []
+        self.repeated_frames = 0  # Trames dont le compteur de séquence n'a pas changé
+        # Appelés avec le numéro de broche à l'entrée du callback, avant la commande (horodatage seul)
+        self.press_listeners = []
+        # Appelés avec le numéro de broche à chaque appui, une fois la commande en file
+        self.button_listeners = []
+        # Disjoncteur par périphérique : un capteur muet n'est plus interrogé à chaque cycle
+        self.health = DeviceHealth()
+
+        # Initialisation I2C (avant les boutons, dont les callbacks utilisent le bus)
+        if bus is None:
+            try:
+                bus = open_smbus(bus_number)  # Bus I2C 1 pour Raspberry Pi
+            except Exception as e:
+                logger.error("Erreur d'initialisation du bus I2C", extra={"event": "i2c_init_error", "error": e})
+        self.bus = bus
+
+        # Toutes les transactions passent par le planificateur, seul propriétaire du bus
+        self.scheduler = I2CScheduler(self.bus) if self.bus else None
+
         # GPIO initialisation
+        self.gpio = GPIO = gpio if gpio is not None else load_gpio()
         GPIO.setmode(GPIO.BCM)
         for pin in self.BUTTONS.values():
             GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
             GPIO.add_event_detect(pin, GPIO.FALLING, callback=self._button_callback, bouncetime=300)
 
-        # Initialisation I2C
-        try:
-            self.bus = smbus.SMBus(1)  # Bus I2C 1 pour Raspberry Pi
-        except Exception as e:
-            print(f"Erreur d'initialisation du bus I2C : {e}")
-            self.bus = None
-
-    def read_sensor_data(self, i2c_address):
+    def read_snapshot(self, i2c_address=None):
         """
-        Lit les données du capteur via I2C.
+        Lit le bloc capteur en une seule transaction I2C et retourne un SensorSnapshot.
+        Le dernier instantané lu est conservé dans self.snapshot.
         """
+        if i2c_address is None:
+            i2c_address = self.I2C_ADDRESSES["sensor"]
         if not self.bus:
-            print("Le bus I2C n'est pas initialisé.")
+            logger.warning("Le bus I2C n'est pas initialisé.", extra={"event": "i2c_no_bus"})
             return None
 
+        breaker = self.health.breaker(i2c_address)
+        if not breaker.allow():
+            return None  # Périphérique hors ligne : aucune transaction avant la prochaine lecture de test
+
         try:
             # Lecture de 16 octets sur l'adresse donnée
-            data = self.bus.read_i2c_block_data(i2c_address, 0, 16)
-            return {
-                'V1': data[0],
-                'V2': data[1],
-                'V3': data[2],
-                'I1': data[3],
-                'I2': data[4],
-                'I3': data[5],
-                'FUEL': data[6],
-                'OIL': data[7],
-                'RPM': (data[8] << 8) | data[9],
-                'MTEMP': data[10]
-            }
+            data = self.scheduler.read_block(i2c_address, 0, 16)
         except Exception as e:
-            print(f"Erreur lors de la lecture I2C ({hex(i2c_address)}): {e}")
+            if breaker.record_failure():
+                logger.warning("Périphérique hors ligne", extra={
+                    "event": "i2c_device_offline", "address": hex(i2c_address),
+                    "failures": breaker.failures, "backoff": breaker.backoff})
+            logger.warning("Erreur lors de la lecture I2C", extra={
+                "event": "i2c_read_error", "address": hex(i2c_address), "state": breaker.state, "error": e})
             return None
+        if breaker.record_success() != "closed":
+            logger.info("Périphérique de nouveau en ligne", extra={
+                "event": "i2c_device_online", "address": hex(i2c_address)})
+        for listener in self.frame_listeners:
+            listener(data)
+        try:
+            self.snapshot = self.decoder.decode(data, timestamp=time.monotonic())
+        except RepeatedFrameError:
+            # Une trame répétée n'apporte rien de nouveau : le dernier instantané est rendu tel quel,
+            # et AcquisitionThread le reconnaît (même objet) pour ne pas le traiter deux fois
+            self.repeated_frames += 1
+            return self.snapshot
+        except FrameError as e:
+            logger.warning("Trame rejetée", extra={"event": "frame_rejected", "address": hex(i2c_address), "error": e})
+            return None
+        return self.snapshot
+
+    @property
+    def sensor_online(self):
+        """Faux tant que le disjoncteur du capteur est ouvert."""
+        return self.health.is_online(self.I2C_ADDRESSES["sensor"])
 
-    def get_voltage(self, sensor_id):
+    def read_sensor_data(self, i2c_address):
+        """
+        Lit les données du capteur via I2C.
+        """
+        snapshot = self.read_snapshot(i2c_address)
+        return snapshot.as_dict() if snapshot else None
+
+    def _snapshot_or_read(self, snapshot):
+        """
+        Retourne l'instantané fourni, ou en lit un nouveau si aucun n'est donné.
+        """
+        return snapshot if snapshot is not None else self.read_snapshot()
+
+    def get_voltage(self, sensor_id, snapshot=None):
         """
         Retourne la tension lue via I2C pour un capteur donné.
         """
-        sensor_data = self.read_sensor_data(self.I2C_ADDRESSES["sensor"])
-        if sensor_data:
-            return sensor_data.get(f'V{sensor_id}', None)
-        print("Données capteur indisponibles.")
+        snapshot = self._snapshot_or_read(snapshot)
+        if snapshot:
+            return snapshot.voltage(sensor_id)
+        logger.warning("Données capteur indisponibles.", extra={"event": "sensor_unavailable"})
         return None
 
-    def get_current(self, sensor_id):
+    def get_current(self, sensor_id, snapshot=None):
         """
         Retourne le courant lu via I2C pour un capteur donné.
         """
-        sensor_data = self.read_sensor_data(self.I2C_ADDRESSES["sensor"])
-        if sensor_data:
-            return sensor_data.get(f'I{sensor_id}', None)
-        print("Données capteur indisponibles.")
+        snapshot = self._snapshot_or_read(snapshot)
+        if snapshot:
+            return snapshot.current(sensor_id)
+        logger.warning("Données capteur indisponibles.", extra={"event": "sensor_unavailable"})
         return None
 
-    def is_power_on(self, sensor_id):
+    def is_power_on(self, sensor_id, snapshot=None):
         """
         Vérifie si le capteur spécifié est sous tension via les données I2C.
         """
-        voltage = self.get_voltage(sensor_id)
+        voltage = self.get_voltage(sensor_id, snapshot)
         return voltage is not None and voltage > 0
 
-    def is_battery_full(self):
+    def is_battery_full(self, snapshot=None):
         """
         Vérifie si la batterie est pleine en fonction des données FUEL via I2C.
         """
-        sensor_data = self.read_sensor_data(self.I2C_ADDRESSES["sensor"])
-        if sensor_data:
-            return sensor_data.get('FUEL', 0) == 100  # Considère 100% comme étant pleine
-        print("Impossible de vérifier l'état de la batterie.")
+        snapshot = self._snapshot_or_read(snapshot)
+        if snapshot:
+            return snapshot.is_battery_full()
+        logger.warning("Impossible de vérifier l'état de la batterie.", extra={"event": "sensor_unavailable"})
         return False
 
-    def get_gauges_values(self):
+    def get_gauges_values(self, snapshot=None):
         """
         Retourne les valeurs des jauges (carburant, huile, RPM) à partir des données I2C.
         """
-        sensor_data = self.read_sensor_data(self.I2C_ADDRESSES["sensor"])
-        if sensor_data:
-            return {
-                "fuel": sensor_data.get('FUEL', 0),
-                "oil": sensor_data.get('OIL', 0),
-                "rpm": sensor_data.get('RPM', 0)
-            }
-        print("Données des jauges indisponibles.")
+        snapshot = self._snapshot_or_read(snapshot)
+        if snapshot:
+            return snapshot.gauges()
+        logger.warning("Données des jauges indisponibles.", extra={"event": "sensor_unavailable"})
         return {"fuel": 0, "oil": 0, "rpm": 0}
 
     def _button_callback(self, channel):
         """
         Callback pour les boutons GPIO.
+        La commande est mise en file avant les listeners : une lecture réveillée par
+        l'échantillonnage rapide ne peut pas passer devant elle sur le bus.
         """
+        for listener in self.press_listeners:
+            listener(channel)
         if channel in self.COMMANDS:
             command = self.COMMANDS[channel]
-            print(f"Commande exécutée pour le bouton {channel} : {command}")
-            self.send_command(command)
+            if channel == self.BUTTONS["emergency"]:
+                self.send_command(command, priority=PRIORITY_EMERGENCY)
+            else:
+                self.send_command(command)
+            logger.info(f"Commande exécutée pour le bouton {channel} : {command}", extra={"event": "button"})
+        for listener in self.button_listeners:
+            listener(channel)
 
-    def send_command(self, command):
+    def send_command(self, command, priority=PRIORITY_COMMAND):
         """
-        Envoie une commande via I2C.
+        Envoie une commande via I2C, en une seule écriture de bloc.
+        Ne bloque pas : retourne un Future résolu une fois la commande sur le bus.
         """
         if not self.bus:
-            print("Le bus I2C n'est pas initialisé.")
-            return
+            future = Future()
+            logger.warning("Le bus I2C n'est pas initialisé.", extra={"event": "i2c_no_bus"})
+            future.set_exception(IOError("Le bus I2C n'est pas initialisé."))
+            return future
 
-        try:
-            for byte in command:
-                self.bus.write_byte(self.I2C_ADDRESSES["avr"], byte)
-                print(f"Commande {byte} envoyée à {hex(self.I2C_ADDRESSES['avr'])}")
-        except Exception as e:
-            print(f"Erreur lors de l'envoi de la commande I2C : {e}")
+        address = self.I2C_ADDRESSES["avr"]
+
+        breaker = self.health.breaker(address)
+
+        def report(done):
+            # Les commandes sont toujours tentées (arrêt d'urgence) ; le disjoncteur ne fait que suivre l'état
+            error = done.exception()
+            if error:
+                breaker.record_failure()
+                logger.warning("Erreur lors de l'envoi de la commande I2C", extra={
+                    "event": "i2c_write_error", "address": hex(address), "error": error})
+            else:
+                breaker.record_success()
+                logger.info(f"Commande {list(command)} envoyée", extra={"event": "command_sent", "address": hex(address)})
+
+        future = self.scheduler.write(address, command, priority)
+        future.add_done_callback(report)
+        return future
 
 
 # Exemple d'utilisation
 if __name__ == "__main__":
-    gpu = I2CInterface()
+    import sys
+
+    if "--simulate" in sys.argv:
+        from sim_backend import SimulatedBus, SimulatedGPIO
+
+        gpu = I2CInterface(bus=SimulatedBus(), gpio=SimulatedGPIO())
+    else:
+        gpu = I2CInterface()
 
-    # Lecture des capteurs
-    sensor_data = gpu.read_sensor_data(I2CInterface.I2C_ADDRESSES["sensor"])
-    if sensor_data:
-        print("Données capteurs :", sensor_data)
+    # Lecture des capteurs (une seule transaction)
+    snapshot = gpu.read_snapshot()
+    if snapshot:
+        print("Données capteurs :", snapshot.as_dict())
 
-    # Lecture des jauges
-    gauges = gpu.get_gauges_values()
-    print("Jauges :", gauges)
+        # Lecture des jauges
+        print("Jauges :", gpu.get_gauges_values(snapshot))
 
-    # Vérification de la tension et du courant
-    for sensor_id in range(1, 4):  # Capteurs S1, S2, S3
-        print(f"Tension capteur S{sensor_id} :", gpu.get_voltage(sensor_id))
-        print(f"Courant capteur S{sensor_id} :", gpu.get_current(sensor_id))
+        # Vérification de la tension et du courant
+        for sensor_id in range(1, 4):  # Capteurs S1, S2, S3
+            print(f"Tension capteur S{sensor_id} :", gpu.get_voltage(sensor_id, snapshot))
+            print(f"Courant capteur S{sensor_id} :", gpu.get_current(sensor_id, snapshot))
 
     # Maintenir le programme en attente pour écouter les boutons
     try:
         input("Appuyez sur Entrée pour quitter...\n")
     finally:
-        GPIO.cleanup()
+        gpu.gpio.cleanup()
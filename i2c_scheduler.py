@@ -0,0 +1,208 @@
+import itertools
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+from panel_logging import get_logger
+
+logger = get_logger("i2c_scheduler")
+
+# Priorités des transactions (la plus petite valeur passe en premier)
+PRIORITY_EMERGENCY = 0
+PRIORITY_COMMAND = 1
+PRIORITY_POLL = 2
+
+PRIORITY_NAMES = {
+    PRIORITY_EMERGENCY: "emergency",
+    PRIORITY_COMMAND: "command",
+    PRIORITY_POLL: "poll",
+}
+
+
+def write_block(bus, address, data):
+    """
+    Écrit une commande complète en une seule transaction I2C.
+    Le premier octet part comme "registre" SMBus, ce qui donne sur le fil la même
+    suite d'octets qu'une écriture brute.
+    """
+    if len(data) == 1:
+        bus.write_byte(address, data[0])
+    else:
+        bus.write_i2c_block_data(address, data[0], list(data[1:]))
+
+
+class I2CRequest:
+    """
+    Transaction en attente : une opération exécutée sur le bus par le planificateur,
+    ou l'écriture d'une commande (payload) pouvant être groupée avec les suivantes.
+    """
+    __slots__ = ("address", "operation", "payload", "priority", "future",
+                 "submitted_at", "started_at", "finished_at")
+
+    def __init__(self, address, operation, priority, payload=None):
+        self.address = address
+        self.operation = operation
+        self.payload = payload
+        self.priority = priority
+        self.future = Future()
+        self.submitted_at = time.monotonic()
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def wait_time(self):
+        """Temps passé dans la file d'attente."""
+        return self.started_at - self.submitted_at
+
+    @property
+    def bus_time(self):
+        """Temps passé sur le bus."""
+        return self.finished_at - self.started_at
+
+
+class I2CScheduler:
+    """
+    Seul propriétaire du bus SMBus : sérialise les lectures et écritures par priorité.
+
+    Les commandes d'urgence passent devant les lectures de télémétrie en attente. Une
+    transaction en cours n'est jamais interrompue.
+    """
+
+    def __init__(self, bus, history=256):
+        self.bus = bus
+        self.history = deque(maxlen=history)  # Dernières transactions terminées
+        self.listeners = []  # Appelés avec (requête, réussie) après chaque transaction
+        self._queue = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._stats_lock = threading.Lock()
+        self._stats = {}
+        self._thread = threading.Thread(target=self._run, name="i2c-scheduler", daemon=True)
+        self._thread.start()
+
+    def submit(self, address, operation, priority=PRIORITY_POLL):
+        """
+        Met en file une opération et retourne un Future.
+        operation : callable recevant le bus, exécuté sur le thread du planificateur.
+        """
+        request = I2CRequest(address, operation, priority)
+        self._queue.put((priority, next(self._seq), request))
+        return request.future
+
+    def write(self, address, data, priority=PRIORITY_COMMAND):
+        """
+        Met en file l'écriture d'une commande (suite d'octets) et retourne un Future.
+        Les écritures en attente vers la même adresse sont envoyées à la suite, sans
+        repasser par la file.
+        """
+        request = I2CRequest(address, None, priority, payload=bytes(data))
+        self._queue.put((priority, next(self._seq), request))
+        return request.future
+
+    def read_block(self, address, register, length, priority=PRIORITY_POLL):
+        """Lecture d'un bloc, bloquante pour l'appelant (jamais pour les autres)."""
+        future = self.submit(address, lambda bus: bus.read_i2c_block_data(address, register, length), priority)
+        return future.result()
+
+    def close(self):
+        """Arrête le planificateur après les transactions déjà en file."""
+        self._queue.put((float("inf"), next(self._seq), None))
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            _, _, request = self._queue.get()
+            if request is None:
+                break
+            if not request.future.set_running_or_notify_cancel():
+                continue
+            if request.payload is not None:
+                self._execute_writes([request] + self._drain_writes(request.address))
+            else:
+                self._execute(request)
+
+    def _drain_writes(self, address):
+        """
+        Retire de la file les écritures qui suivent immédiatement vers la même adresse.
+        """
+        batch = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            request = item[2]
+            if request is None or request.payload is None or request.address != address:
+                self._queue.put(item)
+                break
+            if request.future.set_running_or_notify_cancel():
+                batch.append(request)
+        return batch
+
+    def _execute_writes(self, batch):
+        """Envoie un lot de commandes : une écriture de bloc par commande, enchaînées sans attente."""
+        for request in batch:
+            request.operation = lambda bus, r=request: write_block(bus, r.address, r.payload)
+            self._execute(request)
+
+    def _execute(self, request):
+        request.started_at = time.monotonic()
+        try:
+            result = request.operation(self.bus)
+        except Exception as e:
+            request.finished_at = time.monotonic()
+            self._record(request, ok=False)
+            request.future.set_exception(e)
+            self._notify(request, ok=False)
+        else:
+            request.finished_at = time.monotonic()
+            self._record(request, ok=True)
+            request.future.set_result(result)
+            self._notify(request, ok=True)
+
+    def _notify(self, request, ok):
+        """
+        Appelle les listeners une fois le Future résolu : un listener en erreur est
+        journalisé, sans bloquer l'appelant ni arrêter le planificateur.
+        """
+        for listener in self.listeners:
+            try:
+                listener(request, ok)
+            except Exception as e:
+                logger.exception("Erreur d'un listener du planificateur I2C",
+                                 extra={"event": "i2c_listener_error", "error": e})
+
+    def _record(self, request, ok):
+        self.history.append(request)
+        with self._stats_lock:
+            stats = self._stats.setdefault(request.priority, {
+                "count": 0, "errors": 0,
+                "wait_total": 0.0, "wait_max": 0.0,
+                "bus_total": 0.0, "bus_max": 0.0,
+            })
+            stats["count"] += 1
+            if not ok:
+                stats["errors"] += 1
+            stats["wait_total"] += request.wait_time
+            stats["wait_max"] = max(stats["wait_max"], request.wait_time)
+            stats["bus_total"] += request.bus_time
+            stats["bus_max"] = max(stats["bus_max"], request.bus_time)
+
+    def stats(self):
+        """
+        Temps d'attente et temps bus (moyenne et maximum, en secondes) par priorité.
+        """
+        result = {}
+        with self._stats_lock:
+            for priority, stats in self._stats.items():
+                count = stats["count"]
+                result[PRIORITY_NAMES.get(priority, priority)] = {
+                    "count": count,
+                    "errors": stats["errors"],
+                    "wait_avg": stats["wait_total"] / count,
+                    "wait_max": stats["wait_max"],
+                    "bus_avg": stats["bus_total"] / count,
+                    "bus_max": stats["bus_max"],
+                }
+        return result
@@ -0,0 +1,338 @@
+import argparse
+import json
+import logging
+import sys
+import threading
+import time
+from collections import deque
+
+from panel_logging import get_logger
+
+logger = get_logger("latency")
+
+# Budget de l'arrêt d'urgence, du front GPIO à la fin de l'écriture sur le bus (secondes).
+# La commande passe devant les lectures en attente : au pire, elle attend la fin d'une
+# lecture capteur en cours (16 octets, ~2 ms à 100 kHz), puis sa propre écriture.
+EMERGENCY_BUDGET = 0.010
+
+# Étapes mesurées depuis le front, dans l'ordre
+STAGES = ("callback", "queued", "bus", "frame")
+
+
+def percentile(values, fraction):
+    """Percentile au rang le plus proche d'une liste triée."""
+    if not values:
+        return None
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+class ButtonTrace:
+    """
+    Parcours d'un appui : front GPIO, callback, mise en file, écritures I2C, première trame capteur.
+
+    Les instants sont en secondes de time.monotonic().
+    """
+    __slots__ = ("pin", "button", "command", "edge", "callback", "writes", "frame_read", "frame", "checked")
+
+    def __init__(self, pin, button, command, edge, callback):
+        self.pin = pin
+        self.button = button
+        self.command = command
+        self.edge = edge
+        self.callback = callback
+        self.writes = []  # (mise en file, début, fin, réussie) pour chaque écriture I2C de la commande
+        self.frame_read = None  # Début de la lecture de la première trame postérieure à la commande
+        self.frame = None  # Réception de cette trame
+        self.checked = False  # Budget front -> bus déjà vérifié
+
+    @property
+    def bus_done(self):
+        """Fin de la dernière écriture, ou None si la commande n'est pas encore sur le bus."""
+        return self.writes[-1][2] if self.writes else None
+
+    def latencies(self):
+        """Latence de chaque étape depuis le front (secondes), None si l'étape n'a pas eu lieu."""
+        def since_edge(moment):
+            return moment - self.edge if moment is not None else None
+
+        return {
+            "callback": since_edge(self.callback),
+            "queued": since_edge(self.writes[0][0] if self.writes else None),
+            "bus": since_edge(self.bus_done),
+            "frame": since_edge(self.frame),
+        }
+
+    def as_dict(self):
+        return {
+            "pin": self.pin,
+            "button": self.button,
+            "command": list(self.command) if self.command else None,
+            "edge": self.edge,
+            "callback": self.callback,
+            "writes": [list(write) for write in self.writes],
+            "frame_read": self.frame_read,
+            "frame": self.frame,
+            "latency": self.latencies(),
+        }
+
+
+class ButtonTracer:
+    """
+    Trace chaque appui de bouton jusqu'au bus, puis jusqu'à la première trame capteur
+    lue après la commande.
+
+    S'attache à une I2CInterface par ses listeners (boutons, planificateur, trames) ; avec
+    sim_backend.SimulatedGPIO, les fronts rejetés par l'anti-rebond sont aussi comptés.
+    path : fichier JSON Lines où chaque trace terminée est ajoutée.
+    budgets : latence maximale front -> bus par broche ; un dépassement est journalisé.
+    """
+
+    def __init__(self, path=None, capacity=4096, frame_timeout=2.0, budgets=None, clock=time.monotonic):
+        self.path = path
+        self.frame_timeout = frame_timeout
+        self.budgets = dict(budgets or {})
+        self.clock = clock
+        self.completed = deque(maxlen=capacity)
+        self.rejected_edges = {}  # pin -> fronts ignorés par l'anti-rebond
+        self.budget_violations = {}  # pin -> traces hors budget
+        self._open = []
+        self._edges = {}  # pin -> instant du dernier front accepté, pas encore rattaché à un appui
+        self._last_read_started = None
+        self._lock = threading.Lock()
+        self._file = open(path, "a") if path else None
+        self.buttons = {}
+        self.commands = {}
+        self.avr_address = None
+        self.sensor_address = None
+
+    def attach(self, interface):
+        """Branche le traceur sur une I2CInterface."""
+        self.buttons = {pin: name for name, pin in interface.BUTTONS.items()}
+        self.commands = {pin: bytes(command) for pin, command in interface.COMMANDS.items()}
+        self.avr_address = interface.I2C_ADDRESSES["avr"]
+        self.sensor_address = interface.I2C_ADDRESSES["sensor"]
+        if not self.budgets:
+            self.budgets = {interface.BUTTONS["emergency"]: EMERGENCY_BUDGET}
+        # Avant la mise en file de la commande : le callback est horodaté avant tout autre traitement
+        interface.press_listeners.insert(0, self.on_button)
+        interface.frame_listeners.append(self.on_frame)
+        if interface.scheduler is not None:
+            interface.scheduler.listeners.append(self.on_request)
+        edge_listeners = getattr(interface.gpio, "edge_listeners", None)
+        if edge_listeners is not None:
+            edge_listeners.append(self.on_edge)
+        return self
+
+    # ----- Listeners ----- #
+
+    def on_edge(self, pin, timestamp, accepted):
+        """Front GPIO brut (backend simulé uniquement)."""
+        with self._lock:
+            if accepted:
+                self._edges[pin] = timestamp
+            else:
+                self.rejected_edges[pin] = self.rejected_edges.get(pin, 0) + 1
+
+    def on_button(self, pin):
+        """Entrée du callback de bouton ; sans front connu, le callback sert de front."""
+        now = self.clock()
+        with self._lock:
+            self._expire(now)
+            edge = self._edges.pop(pin, now)
+            self._open.append(ButtonTrace(pin, self.buttons.get(pin, str(pin)), self.commands.get(pin), edge, now))
+
+    def on_request(self, request, ok):
+        """
+        Listener du planificateur : écritures des commandes et lectures du capteur.
+        Le budget front -> bus est vérifié dès la fin de l'écriture, sans attendre de trame
+        (capteur hors ligne : aucune trame n'arrive).
+        """
+        with self._lock:
+            self._expire(self.clock())
+            if request.payload is None:
+                if ok and request.address == self.sensor_address:
+                    self._last_read_started = request.started_at
+                return
+            if request.address != self.avr_address:
+                return
+            for trace in self._open:
+                if trace.command == request.payload and not trace.writes:
+                    trace.writes.append((request.submitted_at, request.started_at, request.finished_at, ok))
+                    self._check_budget(trace)
+                    break
+
+    def on_frame(self, data):
+        """Trame capteur reçue : termine les traces dont la commande l'a précédée sur le bus."""
+        now = self.clock()
+        with self._lock:
+            read_started = self._last_read_started
+            done = []
+            for trace in self._open:
+                bus_done = trace.bus_done
+                if bus_done is not None and read_started is not None and read_started >= bus_done:
+                    trace.frame_read = read_started
+                    trace.frame = now
+                    done.append(trace)
+            for trace in done:
+                self._open.remove(trace)
+                self._complete(trace)
+            self._expire(now)
+
+    def _expire(self, now):
+        """Termine les traces sans trame après frame_timeout (commande perdue ou capteur muet)."""
+        expired = [trace for trace in self._open if now - trace.edge > self.frame_timeout]
+        for trace in expired:
+            self._open.remove(trace)
+            self._complete(trace)
+
+    def _check_budget(self, trace):
+        trace.checked = True
+        budget = self.budgets.get(trace.pin)
+        bus = trace.latencies()["bus"]
+        if budget is not None and (bus is None or bus > budget):
+            self.budget_violations[trace.pin] = self.budget_violations.get(trace.pin, 0) + 1
+            logger.warning(f"Budget de latence dépassé pour {trace.button}", extra={
+                "event": "latency_budget_exceeded",
+                "error": "commande absente du bus" if bus is None else f"{bus * 1000:.2f} ms > {budget * 1000:.2f} ms"})
+
+    def _complete(self, trace):
+        self.completed.append(trace)
+        if not trace.checked:
+            self._check_budget(trace)  # Commande jamais écrite : dépassement constaté à l'expiration
+        if self._file:
+            self._file.write(json.dumps(self._record(trace)) + "\n")
+            self._file.flush()
+
+    def _record(self, trace):
+        record = trace.as_dict()
+        record["budget"] = self.budgets.get(trace.pin)
+        return record
+
+    @property
+    def pending(self):
+        """Nombre d'appuis dont la trace n'est pas encore terminée."""
+        with self._lock:
+            self._expire(self.clock())
+            return len(self._open)
+
+    # ----- Résultats ----- #
+
+    def traces(self):
+        with self._lock:
+            self._expire(self.clock())
+            return list(self.completed)
+
+    def report(self):
+        """Percentiles par bouton et par étape (millisecondes), et respect des budgets."""
+        return summarize([self._record(trace) for trace in self.traces()], self.rejected_edges)
+
+    def dump(self, path):
+        """Écrit les traces terminées en JSON Lines."""
+        with open(path, "w") as f:
+            for trace in self.traces():
+                f.write(json.dumps(self._record(trace)) + "\n")
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+
+def summarize(traces, rejected_edges=None):
+    """
+    Résumé de traces (lignes du fichier de traces) : count, p50, p95, p99 et max par étape,
+    et dépassements du budget front -> bus quand la broche en a un.
+    """
+    by_pin = {}
+    for trace in traces:
+        by_pin.setdefault(trace["pin"], []).append(trace)
+
+    report = {}
+    for pin, pin_traces in sorted(by_pin.items()):
+        stages = {}
+        for stage in STAGES:
+            values = sorted(t["latency"][stage] * 1000 for t in pin_traces if t["latency"][stage] is not None)
+            stages[stage] = {
+                "count": len(values),
+                "p50_ms": percentile(values, 0.50),
+                "p95_ms": percentile(values, 0.95),
+                "p99_ms": percentile(values, 0.99),
+                "max_ms": values[-1] if values else None,
+            }
+        entry = {"pin": pin, "presses": len(pin_traces), "stages": stages}
+        if rejected_edges:
+            entry["rejected_edges"] = rejected_edges.get(pin, 0)
+        budget = pin_traces[-1].get("budget")
+        if budget is not None:
+            entry["budget_ms"] = budget * 1000
+            entry["budget_violations"] = sum(
+                1 for t in pin_traces if t["latency"]["bus"] is None or t["latency"]["bus"] > budget)
+        report[pin_traces[0]["button"]] = entry
+    return report
+
+
+# ========================== SIMULATED RUN ========================== #
+
+def run_simulated(presses, rate, latency, path=None, budget=EMERGENCY_BUDGET, bounces=True):
+    """
+    Appuis scriptés sur le bus simulé, pendant que l'acquisition interroge le capteur à rate Hz.
+    """
+    from acquisition import AcquisitionThread
+    from i2c_interface import I2CInterface
+    from sim_backend import SimulatedBus, SimulatedGPIO
+
+    gpio = SimulatedGPIO()
+    interface = I2CInterface(bus=SimulatedBus(latency=latency), gpio=gpio)
+    tracer = ButtonTracer(path=path, budgets={interface.BUTTONS["emergency"]: budget}).attach(interface)
+    acquisition = AcquisitionThread(interface, period=1.0 / rate)
+    acquisition.start()
+
+    # Chaque bouton à tour de rôle, 0,35 s d'écart (au-delà de l'anti-rebond de 300 ms)
+    pins = list(interface.BUTTONS.values())
+    script = []
+    for i in range(presses):
+        moment = 0.1 + i * 0.35 / len(pins)
+        pin = pins[i % len(pins)]
+        script.append((moment, pin))
+        if bounces:
+            script.append((moment + 0.002, pin))  # Rebond mécanique, filtré par bouncetime
+    gpio.run_script(script).join()
+
+    deadline = time.monotonic() + tracer.frame_timeout + 1.0
+    while tracer.pending and time.monotonic() < deadline:
+        time.sleep(0.01)
+    acquisition.stop()
+    interface.scheduler.close()
+    tracer.close()
+    return tracer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Button-to-bus latency tracing")
+    parser.add_argument("--report", metavar="PATH", help="Summarize an existing trace file instead of running")
+    parser.add_argument("--presses", type=int, default=120, help="Scripted presses on the simulated bus")
+    parser.add_argument("--rate", type=float, default=20.0, help="Sensor polling rate in Hz (default: 20)")
+    parser.add_argument("--latency", type=float, default=0.001, help="Simulated bus transaction time in seconds")
+    parser.add_argument("--budget", type=float, default=EMERGENCY_BUDGET * 1000,
+                        help=f"Emergency stop budget in ms, edge to bus (default: {EMERGENCY_BUDGET * 1000:g})")
+    parser.add_argument("--output", metavar="PATH", help="Write the trace file (JSON Lines) here")
+    args = parser.parse_args()
+    logging.getLogger("gpu_panel.i2c").setLevel(logging.WARNING)  # Pas une ligne par commande
+
+    if args.report:
+        with open(args.report) as f:
+            traces = [json.loads(line) for line in f if line.strip()]
+        print(json.dumps(summarize(traces), indent=2))
+        return 0
+
+    tracer = run_simulated(args.presses, args.rate, args.latency, path=args.output, budget=args.budget / 1000)
+    report = tracer.report()
+    print(json.dumps(report, indent=2))
+    violations = sum(tracer.budget_violations.values())
+    if violations:
+        print(f"EMERGENCY BUDGET EXCEEDED: {violations} press(es) over {args.budget:g} ms", file=sys.stderr)
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,97 @@
+import time
+
+START_TIME = time.monotonic()  # Reference for the startup metrics, taken before any heavy import
+
+import argparse
 import tkinter as tk
-from fuel_gauge import FuelGauge
-from oil_gauge import OilGauge
-from speed_gauge import SpeedGauge
 
 from control_panel import ControlPanelApp
 
 class MainApp:
-    def __init__(self):
+    def __init__(self, refresh_rate=1.0, log_path=None, capture_path=None, simulate=False, units_path=None,
+                 max_rate=10.0, metrics_port=None, trace_path=None, stream_port=None, fullscreen=False,
+                 alarms_path=None):
         self.root = tk.Tk()
-        self.control_panel = ControlPanelApp(self.root)
+        if fullscreen:
+            self.root.attributes("-fullscreen", True)  # The panel scales to the screen resolution
+        if units_path:
+            self.control_panel = self.create_multi_unit_panel(units_path, refresh_rate, simulate)
+            self.root.mainloop()
+            return
+        metrics = None
+        if metrics_port:
+            from metrics import MetricsServer, PanelMetrics
+
+            metrics = PanelMetrics()
+            MetricsServer(metrics.registry, port=metrics_port).start()
+        stream = None
+        if stream_port:
+            from stream_server import StateBroadcaster, StreamServer
+
+            stream = StateBroadcaster()
+            StreamServer(stream, port=stream_port).start()
+        alarm_rules = None
+        if alarms_path:
+            from alarms import load_rules
+
+            alarm_rules = load_rules(alarms_path)
+        source = None
+        if simulate:
+            from i2c_interface import I2CInterface
+            from sim_backend import SimulatedBus, SimulatedGPIO
+
+            source = I2CInterface(bus=SimulatedBus(), gpio=SimulatedGPIO())
+        self.control_panel = ControlPanelApp(self.root, refresh_rate=refresh_rate, start_time=START_TIME,
+                                             log_path=log_path, source=source, capture_path=capture_path,
+                                             max_rate=max_rate, metrics=metrics, trace_path=trace_path,
+                                             stream=stream, alarm_rules=alarm_rules)
         self.root.mainloop()
 
+    def create_multi_unit_panel(self, units_path, refresh_rate, simulate):
+        from i2c_backends import open_smbus
+        from multi_panel import MultiUnitPanel
+        from units import UnitFleet, load_units
+
+        units = load_units(units_path)
+        open_bus = open_smbus
+        if simulate:
+            from sim_backend import SimulatedBus
+
+            def open_bus(bus_number):
+                bus = SimulatedBus(seed=bus_number)
+                for unit in units:
+                    if unit.bus == bus_number:
+                        bus.add_sensor(unit.address)
+                return bus
+
+        fleet = UnitFleet(units, period=1.0 / refresh_rate, open_bus=open_bus)
+        return MultiUnitPanel(self.root, fleet, refresh_rate=refresh_rate)
+
 if __name__ == "__main__":
-    app = MainApp()
+    parser = argparse.ArgumentParser(description="Avion GPU control panel")
+    parser.add_argument("--rate", type=float, default=1.0, help="Display refresh rate in Hz (default: 1)")
+    parser.add_argument("--max-rate", type=float, default=10.0,
+                        help="Fastest adaptive polling rate in Hz while channels change (default: 10)")
+    parser.add_argument("--log", metavar="PATH", help="Rolling telemetry log file (memory-mapped, fixed records)")
+    parser.add_argument("--capture", metavar="PATH", help="Record raw sensor frames for replay.py")
+    parser.add_argument("--simulate", action="store_true", help="Use the simulated SMBus/GPIO backend")
+    parser.add_argument("--metrics-port", type=int, help="Serve Prometheus metrics on this port (/metrics)")
+    parser.add_argument("--stream-port", type=int,
+                        help="Stream live panel state to remote viewers on this port (SSE, /events)")
+    parser.add_argument("--trace", metavar="PATH",
+                        help="Trace button-to-bus latency to this file (JSON Lines, see latency_trace.py)")
+    parser.add_argument("--fullscreen", action="store_true", help="Fill the screen (the panel scales to fit)")
+    parser.add_argument("--alarms", metavar="PATH", help="Alarm rules (JSON) instead of the default limits")
+    parser.add_argument("--units", metavar="PATH", help="Monitor several units described in a JSON file")
+    args = parser.parse_args()
+    if args.units:
+        # The multi-unit table polls its own fleet: these options only apply to the single-unit panel
+        single_unit = {"--log": args.log, "--capture": args.capture, "--metrics-port": args.metrics_port,
+                       "--stream-port": args.stream_port, "--trace": args.trace, "--alarms": args.alarms}
+        unsupported = [option for option, value in single_unit.items() if value]
+        if unsupported:
+            parser.error(f"--units cannot be combined with {', '.join(unsupported)}")
+    app = MainApp(refresh_rate=args.rate, log_path=args.log, capture_path=args.capture, simulate=args.simulate,
+                  units_path=args.units, max_rate=args.max_rate, metrics_port=args.metrics_port,
+                  trace_path=args.trace, stream_port=args.stream_port,
+                  fullscreen=args.fullscreen, alarms_path=args.alarms)
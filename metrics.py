@@ -0,0 +1,242 @@
+import bisect
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from sensor_snapshot import SensorSnapshot
+
+# Bornes par défaut des histogrammes de latence (secondes)
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+def _escape(value):
+    """Échappement d'une valeur d'étiquette Prometheus (noms venant des fichiers JSON)."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, help_text, labels=()):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_labels(self.label_names, key)} {value}")
+        return lines
+
+
+class Counter(_Metric):
+    """Compteur monotone, par jeu d'étiquettes."""
+    kind = "counter"
+
+    def inc(self, *labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def set_total(self, *labels, value):
+        """Recopie un compteur tenu ailleurs (collecte au moment du scrape)."""
+        with self._lock:
+            self._values[labels] = value
+
+
+class Gauge(_Metric):
+    """Valeur instantanée, par jeu d'étiquettes."""
+    kind = "gauge"
+
+    def set(self, *labels, value):
+        with self._lock:
+            self._values[labels] = value
+
+
+class Histogram(_Metric):
+    """Histogramme cumulatif à bornes fixes, par jeu d'étiquettes."""
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labels=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(buckets)
+
+    def observe(self, *labels, value):
+        with self._lock:
+            counts, total = self._values.get(labels, ([0] * (len(self.buckets) + 1), 0.0))
+            counts[bisect.bisect_left(self.buckets, value)] += 1
+            self._values[labels] = (counts, total + value)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            for key, (counts, total) in sorted(self._values.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + ("+Inf",), counts):
+                    cumulative += count
+                    lines.append(f"{self.name}_bucket{_labels(self.label_names, key, [('le', bound)])} {cumulative}")
+                lines.append(f"{self.name}_sum{_labels(self.label_names, key)} {total}")
+                lines.append(f"{self.name}_count{_labels(self.label_names, key)} {cumulative}")
+        return lines
+
+
+class Registry:
+    """
+    Ensemble de métriques ; les collecteurs sont appelés juste avant chaque rendu.
+    """
+
+    def __init__(self):
+        self.metrics = []
+        self.collectors = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector):
+        self.collectors.append(collector)
+
+    def render(self):
+        for collector in self.collectors:
+            collector()
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+class PanelMetrics:
+    """
+    Métriques du panneau : latence I2C, temps de trame, appels Tk, erreurs et valeurs des voies.
+    """
+
+    def __init__(self, registry=None):
+        self.registry = registry or Registry()
+        register = self.registry.register
+        self.i2c_latency = register(Histogram(
+            "gpu_panel_i2c_request_seconds", "I2C request latency, queue wait included",
+            ("address", "operation")))
+        self.i2c_bus_time = register(Histogram(
+            "gpu_panel_i2c_bus_seconds", "Time spent on the bus per I2C request", ("address", "operation")))
+        self.i2c_errors = register(Counter(
+            "gpu_panel_i2c_errors_total", "Failed I2C requests", ("address", "operation")))
+        self.breaker_open = register(Gauge(
+            "gpu_panel_i2c_device_offline", "1 while the device circuit breaker is open", ("address",)))
+        self.breaker_skipped = register(Counter(
+            "gpu_panel_i2c_skipped_total", "Reads skipped because the device was offline", ("address",)))
+        self.breaker_probes = register(Counter(
+            "gpu_panel_i2c_retries_total", "Half-open probe reads (retries) of an offline device", ("address",)))
+        self.frame_time = register(Histogram(
+            "gpu_panel_frame_seconds", "update_display frame time"))
+        self.tk_calls = register(Counter("gpu_panel_tk_calls_total", "Tk calls made by update_display"))
+        self.acquisition = register(Counter(
+            "gpu_panel_acquisition_total", "Acquisition counters", ("counter",)))
+        self.channels = register(Gauge("gpu_panel_channel_value", "Latest raw sensor value", ("channel",)))
+        self.poll_rate = register(Gauge("gpu_panel_poll_rate_hz", "Current acquisition polling rate"))
+        self.rate_boosts = register(Counter(
+            "gpu_panel_poll_rate_boosts_total", "Switches to the fastest polling rate (activity or button)"))
+        self.startup = register(Gauge("gpu_panel_startup_seconds", "Startup milestones since process start",
+                                      ("stage",)))
+        self.alarm_state = register(Gauge(
+            "gpu_panel_alarm_state", "0 normal, 1 active, 2 latched until acknowledged", ("alarm",)))
+        self.alarms_raised = register(Counter("gpu_panel_alarms_raised_total", "Times an alarm was raised", ("alarm",)))
+
+    def observe_request(self, request, ok):
+        """Listener du planificateur I2C : appelé pour chaque transaction terminée."""
+        address = hex(request.address)
+        operation = "write" if request.payload is not None else "read"
+        self.i2c_latency.observe(address, operation, value=request.finished_at - request.submitted_at)
+        self.i2c_bus_time.observe(address, operation, value=request.bus_time)
+        if not ok:
+            self.i2c_errors.inc(address, operation)
+
+    def observe_frame(self, duration, tk_calls):
+        self.frame_time.observe(value=duration)
+        self.tk_calls.inc(amount=tk_calls)
+
+    def observe_snapshot(self, snapshot):
+        """Listener d'acquisition : dernières valeurs des voies."""
+        if snapshot is None:
+            return
+        for field in SensorSnapshot.FIELDS:
+            self.channels.set(field, value=getattr(snapshot, field))
+
+    def collect_health(self, health):
+        """Collecteur : état des disjoncteurs d'un DeviceHealth."""
+        def collect():
+            for address, breaker in list(health.breakers.items()):
+                self.breaker_open.set(hex(address), value=0 if breaker.online else 1)
+                self.breaker_skipped.set_total(hex(address), value=breaker.rejected)
+                self.breaker_probes.set_total(hex(address), value=breaker.probes)
+        self.registry.add_collector(collect)
+
+    def collect_acquisition(self, acquisition):
+        """Collecteur : compteurs d'un AcquisitionThread."""
+        def collect():
+            stats = acquisition.stats()
+            for name, value in stats.items():
+                if isinstance(value, int):
+                    self.acquisition.set_total(name, value=value)
+            if stats["rate_hz"] is not None:
+                self.poll_rate.set(value=stats["rate_hz"])
+            if acquisition.rate_policy is not None:
+                self.rate_boosts.set_total(value=acquisition.rate_policy.boosts)
+        self.registry.add_collector(collect)
+
+    def collect_startup(self, startup_metrics):
+        """Collecteur : jalons de démarrage du panneau (dictionnaire étape -> secondes)."""
+        def collect():
+            for stage, seconds in list(startup_metrics.items()):
+                self.startup.set(stage, value=seconds)
+        self.registry.add_collector(collect)
+
+    def collect_alarms(self, engine):
+        """Collecteur : état de chaque règle d'un AlarmEngine."""
+        levels = {"normal": 0, "active": 1, "latched": 2}
+
+        def collect():
+            for rule, state, raised in zip(engine.rules, engine.states, engine.raised_counts):
+                self.alarm_state.set(rule.name, value=levels[state])
+                self.alarms_raised.set_total(rule.name, value=raised)
+        self.registry.add_collector(collect)
+
+
+class MetricsServer:
+    """
+    Point d'accès HTTP optionnel exposant /metrics au format texte Prometheus.
+    """
+
+    def __init__(self, registry, port=9109, host="0.0.0.0"):
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass  # Pas une ligne de console par scrape
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, name="metrics", daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
@@ -0,0 +1,72 @@
+import tkinter as tk
+
+from refresh_scheduler import FixedRateScheduler
+from sensor_snapshot import SensorSnapshot
+from view_model import ViewModel
+
+# Unit suffix displayed after each channel value
+CHANNEL_SUFFIXES = {
+    "V1": "V", "V2": "V", "V3": "V",
+    "I1": "A", "I2": "A", "I3": "A",
+    "FUEL": "L", "OIL": "L", "RPM": " RPM", "MTEMP": "°C",
+}
+
+
+class UnitRow:
+    """One generated widget set (a table row) for one monitored unit."""
+
+    def __init__(self, parent, row, unit, columns):
+        self.unit = unit
+        tk.Label(parent, text=unit.name, font=("Poppins", 12, "bold"), bg="white", anchor="w").grid(
+            row=row, column=0, sticky="w", padx=8, pady=2)
+        self.status_label = tk.Label(parent, text="...", font=("Poppins", 10), bg="white")
+        self.status_label.grid(row=row, column=1, padx=8)
+        self.channel_labels = {}
+        for column, field in enumerate(columns, start=2):
+            if field in unit.channels:
+                label = tk.Label(parent, text="-", font=("Poppins", 12), bg="white", width=8)
+                label.grid(row=row, column=column, padx=4)
+                self.channel_labels[field] = label
+
+    def update(self, view, snapshot):
+        if snapshot is None:
+            view.configure(self.status_label, text="hors ligne", fg="red")
+            for label in self.channel_labels.values():
+                view.configure(label, text="-", fg="black")
+            return
+        view.configure(self.status_label, text="OK", fg="green")
+        for field, label in self.channel_labels.items():
+            view.configure(label, text=f"{getattr(snapshot, field)}{CHANNEL_SUFFIXES[field]}", fg="black")
+
+
+class MultiUnitPanel:
+    """
+    Monitoring table for several units polled from one process; rows are generated from the
+    unit configuration.
+    """
+
+    def __init__(self, root, fleet, refresh_rate=1.0):
+        self.root = root
+        self.root.title("Avion GPU - Multi-unit monitor")
+        self.root.configure(bg="white")
+        self.fleet = fleet
+
+        columns = [field for field in SensorSnapshot.FIELDS if any(field in unit.channels for unit in fleet.units)]
+        table = tk.Frame(self.root, bg="white")
+        table.pack(padx=10, pady=10)
+        for column, title in enumerate(["Unit", "Status"] + columns):
+            tk.Label(table, text=title, font=("Poppins", 12, "bold"), bg="white").grid(row=0, column=column, padx=4)
+        self.rows = [UnitRow(table, row, unit, columns) for row, unit in enumerate(fleet.units, start=1)]
+
+        self.view = ViewModel()
+        self.refresh = FixedRateScheduler(self.root, self.update_display, rate_hz=refresh_rate)
+        self.fleet.start()
+        self.refresh.start()
+
+    def update_display(self):
+        self.view.begin_frame()
+        for row in self.rows:
+            snapshot, fresh = self.fleet.acquisitions[row.unit.name].poll()
+            if fresh:
+                row.update(self.view, snapshot)
+        self.view.end_frame()
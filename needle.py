@@ -0,0 +1,25 @@
+import math
+
+
+def needle_points(center_x, center_y, length, base_width, angle):
+    """
+    Return the triangle (base1, base2, tip) of a gauge needle as a flat coordinate tuple.
+    angle is in degrees, 0 pointing left and 180 pointing right.
+    """
+    theta = math.radians(180 - angle)
+    cos_t, sin_t = math.cos(theta), math.sin(theta)
+    half = base_width / 2
+    return (center_x + half * sin_t, center_y + half * cos_t,
+            center_x - half * sin_t, center_y - half * cos_t,
+            center_x + length * cos_t, center_y - length * sin_t)
+
+
+def build_needle_table(center_x, center_y, length, base_width, span, steps=360):
+    """Precompute needle coordinates for steps+1 angles evenly spread over 0..span degrees."""
+    return [needle_points(center_x, center_y, length, base_width, span * i / steps)
+            for i in range(steps + 1)]
+
+
+def needle_index(fraction, steps=360):
+    """Map a 0..1 fraction of the scale (clamped) to an index in the needle table."""
+    return round(min(max(fraction, 0.0), 1.0) * steps)
@@ -0,0 +1,62 @@
+# Panel layout, in pixels of the 850x550 window.
+# Shared by the Tk panel (control_panel.py) and the headless renderer (panel_render.py):
+# no tkinter import here.
+
+WINDOW_SIZE = (850, 550)
+OUTER_RECT = (10, 10, 840, 540)
+
+# Images loaded once the skeleton is on screen: attribute -> (path, size)
+IMAGES = {
+    "gpu_image": ("images/gpu_image.jpg", (140, 100)),
+    "airplane_image": ("images/plane_not_connected.jpg", (100, 66)),
+    "airplane_image_full": ("images/plane_full.jpg", (100, 66)),
+    "light_on_image": ("images/light_on.jpg", (50, 50)),
+    "light_off_image": ("images/light_off.jpg", (50, 50)),
+}
+OIL_ICON = ("images/gauge_oil.jpg", (110, 63))
+
+# Sensor sections shown in the status grid, with the connection lines each one lights up
+SECTIONS = (
+    ("S1", ("line1", "line2")),
+    ("S2", ("line3",)),
+    ("S3", ("line4", "line5")),
+    ("S4", ()),
+)
+
+# Top row
+ACTION_BOX = (15, 15, 250, 50)  # x, y, width, height
+ACTION_TEXT = (10, 10)  # Inside the action box
+ALARM_TEXT = (10, 32)  # Active alarm, under the action text
+LIGHT_POSITION = (770, 20)
+GPU_POSITION = (350, 40)
+
+CONNECTION_LINES = {
+    "line1": (400, 90, 150, 90),
+    "line2": (150, 90, 150, 220),
+    "line3": (330, 90, 330, 220),
+    "line4": (520, 90, 520, 220),
+    "line5": (400, 90, 671, 90),
+    "line6": (670, 90, 670, 220),
+}
+LINE_DASH = (5, 2)
+
+AIRPLANE_X = (100, 270, 460, 610)
+AIRPLANE_Y = 180
+
+# Status table: section names, voltages, currents
+STATUS_X = (100, 260, 430, 610)
+STATUS_Y = 270
+STATUS_ROW_HEIGHT = 40
+STATUS_TEXT_OFFSET = 50
+GRID_ORIGIN = (15, 260)
+GRID_RECT = (55, 0, 750, 120)  # Relative to GRID_ORIGIN
+GRID_COLUMN_WIDTH = 170
+
+# Gauges: (title, x), boxes below the status table
+GAUGES = (("Fuel", 120), ("Oil", 350), ("Speed", 580))
+GAUGE_TITLE_Y = 450
+GAUGE_BOX_OFFSET = 15
+GAUGE_BOX_Y = 390
+GAUGE_BOX_SIZE = (120, 100)
+GAUGE_SIZE = (120, 105)
+SPEED_GAUGE = {"max_value": 8000, "min_angle": 30, "max_angle": 180, "num_segments": 5}
@@ -0,0 +1,74 @@
+import logging
+import threading
+import time
+
+# Champs structurés acceptés dans extra=..., ajoutés en clé=valeur à la fin de chaque ligne
+STRUCTURED_FIELDS = ("event", "address", "state", "failures", "backoff", "error", "alarm", "value", "suppressed")
+
+
+class StructuredFormatter(logging.Formatter):
+    """
+    Ligne lisible suivie des champs structurés : ... event=i2c_read_error address=0x41
+    """
+
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    def format(self, record):
+        line = super().format(record)
+        fields = [f"{name}={getattr(record, name)}" for name in STRUCTURED_FIELDS if hasattr(record, name)]
+        return f"{line} {' '.join(fields)}" if fields else line
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Laisse passer un même message (même texte, même adresse) au plus une fois par interval
+    secondes ; le suivant indique combien ont été supprimés entre-temps.
+
+    Les loggers de exempt ne sont jamais limités : chacune de leurs lignes est un changement
+    d'état à conserver (alarmes levées, retombées, acquittées).
+    """
+
+    def __init__(self, interval=10.0, clock=time.monotonic, exempt=("gpu_panel.alarms",)):
+        super().__init__()
+        self.interval = interval
+        self.exempt = frozenset(exempt)
+        self.clock = clock
+        self._last = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.name in self.exempt:
+            return True
+        key = (record.name, record.msg, getattr(record, "address", None))
+        now = self.clock()
+        with self._lock:
+            last, suppressed = self._last.get(key, (None, 0))
+            if last is not None and now - last < self.interval:
+                self._last[key] = (last, suppressed + 1)
+                return False
+            self._last[key] = (now, 0)
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+_configured = False
+
+
+def get_logger(name):
+    """
+    Logger du panneau ("gpu_panel.<name>"), configuré une fois : sortie console structurée
+    et limitation de débit.
+    """
+    global _configured
+    root = logging.getLogger("gpu_panel")
+    if not _configured:
+        _configured = True
+        handler = logging.StreamHandler()
+        handler.setFormatter(StructuredFormatter())
+        handler.addFilter(RateLimitFilter())
+        root.addHandler(handler)
+        root.setLevel(logging.INFO)
+        root.propagate = False
+    return root.getChild(name)
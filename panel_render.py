@@ -0,0 +1,175 @@
+import math
+
+from PIL import Image, ImageDraw, ImageFont
+
+from asset_cache import default_cache
+from needle import build_needle_table, needle_index
+from panel_layout import (
+    ACTION_BOX, ACTION_TEXT, AIRPLANE_X, AIRPLANE_Y, ALARM_TEXT, CONNECTION_LINES, GAUGE_BOX_OFFSET,
+    GAUGE_BOX_SIZE, GAUGE_BOX_Y, GAUGE_SIZE, GAUGE_TITLE_Y, GAUGES, GPU_POSITION, GRID_COLUMN_WIDTH, GRID_ORIGIN,
+    GRID_RECT, IMAGES, LIGHT_POSITION, LINE_DASH, OIL_ICON, OUTER_RECT, SECTIONS, SPEED_GAUGE, STATUS_ROW_HEIGHT,
+    STATUS_TEXT_OFFSET, STATUS_X, STATUS_Y, WINDOW_SIZE,
+)
+
+
+def _font(size, bold=False):
+    """Police TrueType si disponible, sinon la police bitmap de PIL."""
+    for name in (("DejaVuSans-Bold.ttf", "Arial Bold.ttf") if bold else ("DejaVuSans.ttf", "Arial.ttf")):
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+
+def _dashed_line(draw, coords, dash, fill, width):
+    """Ligne pointillée (Tk dash=(trait, espace)), que PIL ne sait pas tracer."""
+    x0, y0, x1, y1 = coords
+    length = math.hypot(x1 - x0, y1 - y0)
+    if not length:
+        return
+    dx, dy = (x1 - x0) / length, (y1 - y0) / length
+    on, off = dash
+    position = 0.0
+    while position < length:
+        end = min(position + on, length)
+        draw.line((x0 + dx * position, y0 + dy * position, x0 + dx * end, y0 + dy * end), fill=fill, width=width)
+        position = end + off
+
+
+def _tk_arc(draw, box, start, extent, **options):
+    """Arc Tk (degrés, sens trigonométrique depuis 3 h) vers PIL (sens horaire)."""
+    draw.arc(box, start=-(start + extent), end=-start, **options)
+
+
+class PanelRenderer:
+    """
+    Rendu du panneau dans une image PIL, avec la disposition de panel_layout et sans Tk.
+
+    Les images sont lues dans le cache d'assets (fichiers PPM déjà redimensionnés).
+    """
+
+    def __init__(self, cache=default_cache):
+        self.cache = cache
+        self.font = _font(14)
+        self.bold = _font(14, bold=True)
+        self.small = _font(11, bold=True)
+        self._images = {}
+
+    def image(self, path, size):
+        key = (path, tuple(size))
+        if key not in self._images:
+            try:
+                self._images[key] = Image.open(self.cache.prepare(path, size)).convert("RGB")
+            except Exception:
+                self._images[key] = None  # Image manquante : le reste du panneau est rendu quand même
+        return self._images[key]
+
+    def render(self, snapshot, online=True, is_on=True, alarm=""):
+        """Image RGB du panneau pour snapshot (None : aucune lecture), alarm : texte de l'alarme active."""
+        panel = Image.new("RGB", WINDOW_SIZE, "white")
+        draw = ImageDraw.Draw(panel)
+        draw.rectangle(OUTER_RECT, outline="black", width=2)
+
+        # Action box
+        x, y, width, height = ACTION_BOX
+        draw.rectangle((x, y, x + width, y + height), outline="black", width=2)
+        text, color = ("Action", "black") if online else ("Capteur hors ligne", "red")
+        draw.text((x + ACTION_TEXT[0], y + ACTION_TEXT[1]), text, fill=color, font=self.bold)
+        if alarm:
+            draw.text((x + ALARM_TEXT[0], y + ALARM_TEXT[1]), alarm, fill="red", font=self.small)
+
+        self._paste(panel, IMAGES["light_on_image" if is_on else "light_off_image"], LIGHT_POSITION)
+        self._paste(panel, IMAGES["gpu_image"], GPU_POSITION)
+
+        # Connection lines and airplanes
+        active = set()
+        for sensor_id, lines in SECTIONS:
+            if lines and snapshot and snapshot.current(sensor_id):
+                active.update(lines)
+        for name, coords in CONNECTION_LINES.items():
+            if name in active:
+                draw.line(coords, fill="blue", width=2)
+            else:
+                _dashed_line(draw, coords, LINE_DASH, "black", 2)
+        battery_full = bool(snapshot and snapshot.is_battery_full())
+        for i, x in enumerate(AIRPLANE_X):
+            name = "airplane_image_full" if i == 0 and battery_full else "airplane_image"
+            self._paste(panel, IMAGES[name], (x, AIRPLANE_Y))
+
+        self._status_grid(draw, snapshot)
+        self._gauges(panel, draw, snapshot.gauges() if snapshot else {"fuel": 0, "oil": 0, "rpm": 0})
+        return panel
+
+    def save(self, path, snapshot, online=True, is_on=True, alarm=""):
+        """Écrit le rendu en PNG."""
+        self.render(snapshot, online, is_on, alarm).save(path, format="PNG")
+        return path
+
+    def _paste(self, panel, image_spec, position):
+        image = self.image(*image_spec)
+        if image is not None:
+            panel.paste(image, position)
+
+    def _status_grid(self, draw, snapshot):
+        ox, oy = GRID_ORIGIN
+        left, top, right, bottom = GRID_RECT
+        draw.rectangle((ox + left, oy + top, ox + right, oy + bottom), outline="black", width=2)
+        for i in range(1, len(SECTIONS)):
+            x = ox + left + i * GRID_COLUMN_WIDTH
+            draw.line((x, oy + top, x, oy + bottom), fill="black", width=2)
+        for row in (1, 2):
+            y = oy + top + row * STATUS_ROW_HEIGHT
+            draw.line((ox + left, y, ox + right, y), fill="black", width=2)
+
+        for (sensor_id, lines), pos in zip(SECTIONS, STATUS_X):
+            x = pos + STATUS_TEXT_OFFSET
+            draw.text((x, STATUS_Y), sensor_id, fill="black", font=self.bold)
+            voltage = snapshot.voltage(sensor_id) if snapshot and lines else None
+            current = snapshot.current(sensor_id) if snapshot and lines else None
+            if voltage is not None:
+                draw.text((x, STATUS_Y + STATUS_ROW_HEIGHT), f"{voltage}V", fill="black", font=self.font)
+            else:
+                draw.text((x, STATUS_Y + STATUS_ROW_HEIGHT), "OFF", fill="red", font=self.font)
+            draw.text((x, STATUS_Y + 2 * STATUS_ROW_HEIGHT), f"{current}A" if current is not None else "-",
+                      fill="black", font=self.font)
+
+    def _gauges(self, panel, draw, values):
+        for title, x_position in GAUGES:
+            draw.text((x_position - len(title) * 9, GAUGE_TITLE_Y), title, fill="black", font=self.bold)
+            box_x = x_position + GAUGE_BOX_OFFSET
+            draw.rectangle((box_x - 2, GAUGE_BOX_Y - 2, box_x + GAUGE_BOX_SIZE[0] + 1,
+                            GAUGE_BOX_Y + GAUGE_BOX_SIZE[1] + 1), outline="black", width=2)
+            if title == "Fuel":
+                self._dial(draw, box_x, 100, values["fuel"], f"{values['fuel']}L", 0, 180, fuel=True)
+            elif title == "Oil":
+                self._paste(panel, OIL_ICON, (box_x + (GAUGE_BOX_SIZE[0] - OIL_ICON[1][0]) // 2, GAUGE_BOX_Y))
+                draw.text((box_x + GAUGE_BOX_SIZE[0] // 2, GAUGE_BOX_Y + OIL_ICON[1][1] + 8),
+                          f"{values['oil']}L", fill="black", font=self.bold, anchor="mt")
+            else:
+                self._dial(draw, box_x, SPEED_GAUGE["max_value"], values["rpm"], f"{values['rpm']} RPM",
+                           SPEED_GAUGE["min_angle"], SPEED_GAUGE["max_angle"], fuel=False)
+
+    def _dial(self, draw, box_x, max_value, value, label, min_angle, max_angle, fuel):
+        """Cadran à aiguille, même géométrie que FuelGauge / SpeedGauge."""
+        width, height = GAUGE_SIZE
+        cx, cy, radius = box_x + width // 2, GAUGE_BOX_Y + height // 1.5, height // 2
+        span = max_angle - min_angle
+        if fuel:
+            _tk_arc(draw, (cx - radius, cy - radius, cx + radius, cy + radius), 0, 180, fill="black", width=5)
+            for i in range(11):
+                angle = math.radians(180 - i * 18)
+                draw.line((cx + (radius - 10) * math.cos(angle), cy - (radius - 10) * math.sin(angle),
+                           cx + radius * math.cos(angle), cy - radius * math.sin(angle)),
+                          fill="red" if i == 0 else "black", width=4 if i in (0, 5, 10) else 2)
+        else:
+            segments = SPEED_GAUGE["num_segments"]
+            for i in range(segments):
+                arc_width = 20 - (i / (segments - 1)) * 15 if segments > 1 else 20
+                inner = radius - arc_width / 2
+                _tk_arc(draw, (cx - inner, cy - inner, cx + inner, cy + inner),
+                        min_angle + i * span / segments, span / segments - 2, fill="black", width=int(arc_width))
+        draw.ellipse((cx - 10, cy - 10, cx + 10, cy + 10), fill="black")
+        table = build_needle_table(cx, cy, radius - 15, 8, span)
+        draw.polygon(table[needle_index(value / max_value)], fill="red", outline="red")
+        draw.text((cx, cy + 14), label, fill="black", font=self.bold, anchor="mt")
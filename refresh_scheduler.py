@@ -0,0 +1,76 @@
+import time
+
+
+class FixedRateScheduler:
+    """
+    Calls a callback on the Tk loop at a fixed rate, against a monotonic clock.
+
+    Deadlines are computed from the start time, so the callback's own duration does not
+    make the period drift. Frames that could not start in time are skipped, not queued.
+    """
+
+    def __init__(self, root, callback, rate_hz=1.0, clock=time.monotonic):
+        self.root = root
+        self.callback = callback
+        self.clock = clock
+        self.set_rate(rate_hz)
+        self._after_id = None
+        self.reset_stats()
+
+    def set_rate(self, rate_hz):
+        """Change the target refresh rate; takes effect from the next frame."""
+        self.rate_hz = rate_hz
+        self.period = 1.0 / rate_hz
+
+    def reset_stats(self):
+        self.frames = 0
+        self.overruns = 0  # Frames whose callback ran past the next deadline
+        self.skipped_frames = 0  # Deadlines dropped to catch up after an overrun
+        self.jitter_total = 0.0
+        self.jitter_max = 0.0
+        self._started_at = None
+
+    def start(self):
+        now = self.clock()
+        self._started_at = now
+        self._next = now
+        self._after_id = self.root.after(0, self._tick)
+
+    def stop(self):
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _tick(self):
+        now = self.clock()
+        jitter = abs(now - self._next)
+        self.jitter_total += jitter
+        self.jitter_max = max(self.jitter_max, jitter)
+        self.frames += 1
+
+        self.callback()
+
+        self._next += self.period
+        end = self.clock()
+        if end > self._next:
+            # Overrun: skip the deadlines already missed instead of firing them back to back
+            missed = int((end - self._next) // self.period) + 1
+            self.overruns += 1
+            self.skipped_frames += missed
+            self._next += missed * self.period
+        if self._after_id is not None:
+            delay_ms = max(0, round((self._next - self.clock()) * 1000))
+            self._after_id = self.root.after(delay_ms, self._tick)
+
+    def stats(self):
+        """Target and achieved frame rate, jitter (seconds), overruns and skipped frames."""
+        elapsed = self.clock() - self._started_at if self._started_at is not None else 0.0
+        return {
+            "target_fps": self.rate_hz,
+            "achieved_fps": self.frames / elapsed if elapsed > 0 else 0.0,
+            "frames": self.frames,
+            "jitter_avg": self.jitter_total / self.frames if self.frames else 0.0,
+            "jitter_max": self.jitter_max,
+            "overruns": self.overruns,
+            "skipped_frames": self.skipped_frames,
+        }
@@ -0,0 +1,42 @@
+import argparse
+import tkinter as tk
+
+from control_panel import ControlPanelApp
+from sensor_capture import ReplaySource
+
+
+def parse_speed(value):
+    """"max" for as fast as possible, otherwise a multiplier such as 1, 10 or 100."""
+    return None if value == "max" else float(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drive the control panel from a recorded sensor capture")
+    parser.add_argument("capture", help="Capture file recorded with main.py --capture")
+    parser.add_argument("--speed", type=parse_speed, default=1.0, help="1, 10, 100... or max (default: 1)")
+    parser.add_argument("--start", type=float, help="Start at this capture timestamp (epoch seconds)")
+    parser.add_argument("--rate", type=float, default=1.0, help="Display refresh rate in Hz (default: 1)")
+    parser.add_argument("--loop", action="store_true", help="Restart from the beginning at the end of the capture")
+    parser.add_argument("--exit", action="store_true", help="Close the window at the end of the capture")
+    args = parser.parse_args()
+
+    source = ReplaySource(args.capture, speed=args.speed, start=args.start, loop=args.loop)
+    root = tk.Tk()
+    panel = ControlPanelApp(root, refresh_rate=args.rate, source=source)
+
+    def check_finished():
+        if source.finished and args.exit:
+            root.destroy()
+        else:
+            root.after(200, check_finished)
+
+    root.after(200, check_finished)
+    root.mainloop()
+
+    print(f"Trames rejouées : {source.frames}")
+    print("Rafraîchissement :", panel.refresh.stats())
+    print("Acquisition :", panel.acquisition.stats() if panel.acquisition else {})
+
+
+if __name__ == "__main__":
+    main()
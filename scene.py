@@ -0,0 +1,188 @@
+import threading
+
+from asset_cache import default_cache
+from panel_logging import get_logger
+
+logger = get_logger("scene")
+
+# Images are resampled at multiples of this scale only: resizing the window keeps a
+# bounded set of cached sizes instead of one PPM and one PhotoImage per pixel of width
+IMAGE_SCALE_STEP = 0.125
+
+
+class SceneNode:
+    """One canvas item, kept in design coordinates (the 850x550 layout)."""
+    __slots__ = ("item", "kind", "coords", "options")
+
+    def __init__(self, kind, coords, options):
+        self.item = None
+        self.kind = kind
+        self.coords = coords
+        self.options = options
+
+
+class Scene:
+    """
+    The whole panel as items on one canvas.
+
+    Nodes are described in design coordinates and drawn at the current scale, so the
+    same layout fills a 480p or a 1080p screen. Updates are batched: set() and move()
+    only record what changed, and flush() turns each changed node into at most one
+    coords and one itemconfig call.
+
+    Images are given as (path, size) specs and resolved through the asset cache at the
+    scaled size, rounded to IMAGE_SCALE_STEP. On a resize, images for the new size are
+    prepared off the Tk thread and swapped in when ready; the old PhotoImages are released.
+    """
+
+    def __init__(self, canvas, design_size, cache=default_cache):
+        self.canvas = canvas
+        self.design_size = design_size
+        self.cache = cache
+        self.scale = 1.0
+        self.image_scale = 1.0
+        self.nodes = []
+        self._photos = set()  # (path, size) PhotoImages loaded at image_scale
+        self._image_job = None  # image_scale being prepared in the background
+        self._pending = {}  # node -> changed options ("coords" for a move)
+        self.frame_calls = 0  # Tk calls made by the current frame
+        self.last_frame_calls = 0  # Tk calls made by the last completed frame
+        self.total_calls = 0
+        self.frames = 0
+
+    # ----- Building ----- #
+
+    def add(self, kind, *coords, **options):
+        """Create a canvas item (kind: "line", "text", "image", ...) and return its node."""
+        node = SceneNode(kind, coords, options)
+        create = getattr(self.canvas, f"create_{kind}")
+        node.item = create(*self._scaled_coords(coords), **self._scaled_options(options))
+        self.nodes.append(node)
+        return node
+
+    def _scaled_coords(self, coords):
+        return [value * self.scale for value in coords]
+
+    def _scaled_options(self, options):
+        scaled = dict(options)
+        if "font" in options:
+            family, size, *style = options["font"]
+            scaled["font"] = (family, max(1, round(size * self.scale)), *style)
+        if "width" in options:
+            scaled["width"] = max(1, round(options["width"] * self.scale))
+        if "image" in options:
+            scaled["image"] = self._photo(options["image"])
+        return scaled
+
+    @staticmethod
+    def _image_size(size, scale):
+        width, height = size
+        return max(1, round(width * scale)), max(1, round(height * scale))
+
+    def _photo(self, spec):
+        if spec is None:
+            return ""
+        path, size = spec
+        size = self._image_size(size, self.image_scale)
+        try:
+            photo = self.cache.photo(path, size)
+            self._photos.add((path, size))
+            return photo
+        except Exception as e:
+            logger.error(f"Error loading image {path}", extra={"event": "asset_error", "error": e})
+            return ""
+
+    # ----- Batched updates ----- #
+
+    def set(self, node, **options):
+        """Record option changes; nothing reaches Tk before flush()."""
+        changed = {name: value for name, value in options.items() if node.options.get(name) != value}
+        if changed:
+            node.options.update(changed)
+            self._pending.setdefault(node, {}).update(changed)
+
+    def move(self, node, *coords):
+        """Record new design coordinates for node."""
+        if coords != node.coords:
+            node.coords = coords
+            self._pending.setdefault(node, {})["coords"] = coords
+
+    def flush(self):
+        """Apply every recorded change; returns the number of Tk calls made."""
+        calls = 0
+        pending, self._pending = self._pending, {}
+        for node, changes in pending.items():
+            coords = changes.pop("coords", None)
+            if coords is not None:
+                self.canvas.coords(node.item, *self._scaled_coords(coords))
+                calls += 1
+            if changes:
+                self.canvas.itemconfig(node.item, **self._scaled_options(changes))
+                calls += 1
+        self.frame_calls += calls
+        return calls
+
+    def begin_frame(self):
+        self.frame_calls = 0
+
+    def end_frame(self):
+        """Flush the frame and return how many Tk calls it made."""
+        self.flush()
+        self.last_frame_calls = self.frame_calls
+        self.total_calls += self.frame_calls
+        self.frames += 1
+        return self.frame_calls
+
+    # ----- Scaling ----- #
+
+    def resize(self, width, height):
+        """Scale the whole scene to fit width x height, keeping the design aspect ratio."""
+        scale = min(width / self.design_size[0], height / self.design_size[1])
+        if abs(scale - self.scale) < 1e-3:
+            return
+        self.scale = scale
+        self.flush()
+        for node in self.nodes:
+            self.canvas.coords(node.item, *self._scaled_coords(node.coords))
+            resized = {name: node.options[name] for name in ("font", "width") if name in node.options}
+            if resized:
+                self.canvas.itemconfig(node.item, **self._scaled_options(resized))
+        image_scale = max(IMAGE_SCALE_STEP, round(scale / IMAGE_SCALE_STEP) * IMAGE_SCALE_STEP)
+        if image_scale != (self._image_job or self.image_scale):
+            self._prepare_images(image_scale)
+
+    def _prepare_images(self, image_scale):
+        """Resize the images for image_scale on a background thread, then swap them in."""
+        self._image_job = image_scale
+        specs = {node.options["image"] for node in self.nodes if node.options.get("image")}
+        done = threading.Event()
+
+        def prepare():
+            for path, size in specs:
+                try:
+                    self.cache.prepare(path, self._image_size(size, image_scale))
+                except Exception:
+                    pass  # Reported by _photo when the image is applied
+            done.set()
+
+        threading.Thread(target=prepare, name="scene-images", daemon=True).start()
+        self._apply_images(image_scale, done)
+
+    def _apply_images(self, image_scale, done):
+        if not done.is_set():
+            self.canvas.after(20, self._apply_images, image_scale, done)
+            return
+        if image_scale != self._image_job:
+            return  # Superseded by a later resize
+        self._image_job = None
+        self.image_scale = image_scale
+        old_photos, self._photos = self._photos, set()
+        for node in self.nodes:
+            if "image" in node.options:
+                self.canvas.itemconfig(node.item, image=self._photo(node.options["image"]))
+        for path, size in old_photos - self._photos:
+            self.cache.discard(path, size)
+
+    def fit(self):
+        """Follow the canvas size (pack it with fill="both", expand=True)."""
+        self.canvas.bind("<Configure>", lambda event: self.resize(event.width, event.height), add="+")
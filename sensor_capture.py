@@ -0,0 +1,131 @@
+import os
+import struct
+import time
+
+from sensor_snapshot import SensorSnapshot
+
+# Capture brute : en-tête, puis enregistrements fixes (horodatage epoch, bloc de 16 octets)
+HEADER = struct.Struct("<4sHH")
+MAGIC = b"GPUC"
+VERSION = 1
+FRAME_SIZE = 16
+RECORD = struct.Struct(f"<d{FRAME_SIZE}s")
+
+
+class CaptureWriter:
+    """
+    Enregistre les blocs bruts lus sur le capteur, tels que read_snapshot les décode.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+
+    def write(self, data, timestamp=None):
+        """Listener de trames brutes d'I2CInterface."""
+        self._file.write(RECORD.pack(time.time() if timestamp is None else timestamp, bytes(data)))
+
+    def close(self):
+        self._file.close()
+
+
+class CaptureReader:
+    """
+    Lecture en flux d'une capture : mémoire constante, accès direct par index.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        magic, version, record_size = HEADER.unpack(self._file.read(HEADER.size))
+        if magic != MAGIC or record_size != RECORD.size:
+            raise ValueError(f"Capture invalide : {path}")
+        self.count = (os.fstat(self._file.fileno()).st_size - HEADER.size) // RECORD.size
+        self.position = 0
+
+    def __len__(self):
+        return self.count
+
+    def record(self, index):
+        """(horodatage, bloc brut) de l'enregistrement index."""
+        self._file.seek(HEADER.size + index * RECORD.size)
+        return RECORD.unpack(self._file.read(RECORD.size))
+
+    def seek(self, timestamp):
+        """
+        Se place sur le premier enregistrement à partir de timestamp (recherche dichotomique).
+        """
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self.record(middle)[0] < timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        self.position = low
+        return low
+
+    def next(self):
+        """Enregistrement suivant, ou None en fin de capture."""
+        if self.position >= self.count:
+            return None
+        record = self.record(self.position)
+        self.position += 1
+        return record
+
+    def close(self):
+        self._file.close()
+
+
+class ReplaySource:
+    """
+    Source d'instantanés rejouant une capture, à la place d'I2CInterface.
+
+    speed : 1.0 pour le temps réel, 10.0 pour dix fois plus vite, None pour aller
+    aussi vite que possible.
+    """
+    # Le rythme vient de la capture : la boucle d'acquisition n'attend pas entre deux lectures
+    poll_period = 0.0
+
+    def __init__(self, path, speed=1.0, start=None, loop=False):
+        self.reader = CaptureReader(path)
+        self.speed = speed
+        self.loop = loop
+        self.finished = False
+        self.frames = 0
+        self.snapshot = None
+        if start is not None:
+            self.reader.seek(start)
+        self._origin = None  # (horodatage capture, instant monotone) du premier enregistrement rejoué
+
+    def seek(self, timestamp):
+        """Saute à timestamp ; le rythme repart de l'enregistrement trouvé."""
+        self.reader.seek(timestamp)
+        self._origin = None
+        self.finished = False
+
+    def read_snapshot(self):
+        record = self.reader.next()
+        if record is None and self.loop and self.reader.count:
+            self.reader.position = 0
+            self._origin = None
+            record = self.reader.next()
+        if record is None:
+            # Fin de capture : le panneau garde la dernière trame affichée
+            self.finished = True
+            time.sleep(0.1)  # Ne pas faire tourner la boucle d'acquisition à vide
+            return self.snapshot
+
+        timestamp, data = record
+        if self.speed:
+            if self._origin is None:
+                self._origin = (timestamp, time.monotonic())
+            due = self._origin[1] + (timestamp - self._origin[0]) / self.speed
+            delay = due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        self.frames += 1
+        self.snapshot = SensorSnapshot.from_block(data, timestamp=timestamp)
+        return self.snapshot
@@ -0,0 +1,143 @@
+import struct
+
+# Bloc de 16 octets : V1-V3, I1-I3, FUEL, OIL (octets), RPM (16 bits gros-boutiste), MTEMP,
+# puis SEQ (compteur de trames), 3 octets réservés et CHECKSUM (somme des octets 0 à 14, modulo 256)
+FRAME = struct.Struct(">8BHBB3xB")
+FRAME_SIZE = 16
+SEQUENCE_INDEX = 11
+CHECKSUM_INDEX = 15
+
+
+class FrameError(ValueError):
+    """
+    Trame capteur rejetée (somme de contrôle fausse, trame répétée ou tronquée).
+    """
+
+
+class RepeatedFrameError(FrameError):
+    """
+    Trame dont le compteur de séquence n'a pas changé depuis la précédente.
+    """
+
+
+class SensorSnapshot:
+    """
+    Instantané typé d'une lecture du capteur (0x41).
+
+    Toutes les voies proviennent du même bloc de 16 octets, donc du même instant.
+    """
+    FIELDS = ("V1", "V2", "V3", "I1", "I2", "I3", "FUEL", "OIL", "RPM", "MTEMP")
+
+    __slots__ = FIELDS + ("timestamp",)
+
+    def __init__(self, V1=0, V2=0, V3=0, I1=0, I2=0, I3=0, FUEL=0, OIL=0, RPM=0, MTEMP=0, timestamp=None):
+        self.V1 = V1
+        self.V2 = V2
+        self.V3 = V3
+        self.I1 = I1
+        self.I2 = I2
+        self.I3 = I3
+        self.FUEL = FUEL
+        self.OIL = OIL
+        self.RPM = RPM
+        self.MTEMP = MTEMP
+        self.timestamp = timestamp
+
+    @classmethod
+    def from_block(cls, data, timestamp=None):
+        """
+        Décode un bloc brut de 16 octets lu sur le capteur.
+        """
+        return cls.decode_into(cls.__new__(cls), data, timestamp)
+
+    @staticmethod
+    def decode_into(snapshot, data, timestamp=None):
+        """
+        Remplit snapshot en place à partir d'un bloc brut, sans dict ni liste intermédiaire.
+        """
+        (snapshot.V1, snapshot.V2, snapshot.V3, snapshot.I1, snapshot.I2, snapshot.I3,
+         snapshot.FUEL, snapshot.OIL, snapshot.RPM, snapshot.MTEMP, _sequence, _checksum) = FRAME.unpack_from(bytes(data))
+        snapshot.timestamp = timestamp
+        return snapshot
+
+    @staticmethod
+    def _channel(sensor_id):
+        """
+        Accepte 1, "1" ou "S1" et retourne le numéro de voie (1 à 3), sinon None.
+        """
+        try:
+            index = int(str(sensor_id).upper().lstrip("S"))
+        except ValueError:
+            return None
+        return index if 1 <= index <= 3 else None
+
+    def voltage(self, sensor_id):
+        """Tension de la voie donnée, ou None si la voie n'existe pas."""
+        index = self._channel(sensor_id)
+        return getattr(self, f"V{index}") if index else None
+
+    def current(self, sensor_id):
+        """Courant de la voie donnée, ou None si la voie n'existe pas."""
+        index = self._channel(sensor_id)
+        return getattr(self, f"I{index}") if index else None
+
+    def is_battery_full(self):
+        """Considère 100% de FUEL comme une batterie pleine."""
+        return self.FUEL == 100
+
+    def gauges(self):
+        """Valeurs des jauges (carburant, huile, RPM)."""
+        return {"fuel": self.FUEL, "oil": self.OIL, "rpm": self.RPM}
+
+    def as_dict(self):
+        """Représentation dict historique de read_sensor_data."""
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __eq__(self, other):
+        if not isinstance(other, SensorSnapshot):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self.FIELDS)
+
+    def __repr__(self):
+        values = ", ".join(f"{f}={getattr(self, f)}" for f in self.FIELDS)
+        return f"SensorSnapshot({values})"
+
+
+def frame_checksum(data):
+    """Somme de contrôle d'un bloc : somme des octets 0 à 14, modulo 256."""
+    return sum(data[:CHECKSUM_INDEX]) & 0xFF
+
+
+class FrameDecoder:
+    """
+    Décodeur de trames avec contrôle d'intégrité optionnel.
+
+    verify_checksum : rejette les trames dont l'octet 15 ne correspond pas (trames déchirées).
+    check_sequence : rejette une trame dont le compteur (octet 11) n'a pas changé (trame répétée).
+    """
+
+    def __init__(self, verify_checksum=False, check_sequence=False):
+        self.verify_checksum = verify_checksum
+        self.check_sequence = check_sequence
+        self.last_sequence = None
+        self.rejected_checksum = 0
+        self.rejected_repeats = 0
+
+    def decode(self, data, timestamp=None, into=None):
+        """
+        Décode data dans into (ou un nouvel instantané) ; lève FrameError si la trame est rejetée.
+        """
+        if len(data) < FRAME_SIZE:
+            raise FrameError(f"Trame tronquée ({len(data)} octets)")
+        if self.verify_checksum and frame_checksum(data) != data[CHECKSUM_INDEX]:
+            self.rejected_checksum += 1
+            raise FrameError("Somme de contrôle invalide")
+        if self.check_sequence:
+            sequence = data[SEQUENCE_INDEX]
+            if sequence == self.last_sequence:
+                self.rejected_repeats += 1
+                raise RepeatedFrameError(f"Trame répétée (séquence {sequence})")
+            self.last_sequence = sequence
+        if into is None:
+            into = SensorSnapshot.__new__(SensorSnapshot)
+        return SensorSnapshot.decode_into(into, data, timestamp)
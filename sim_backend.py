@@ -0,0 +1,172 @@
+import errno
+import random
+import threading
+import time
+
+from sensor_snapshot import CHECKSUM_INDEX, SEQUENCE_INDEX, frame_checksum
+
+
+class SimulatedSensor:
+    """
+    Capteur simulé (0x41) : produit des blocs de 16 octets au format de read_snapshot.
+
+    frames : liste optionnelle de blocs rejoués en boucle ; sinon un modèle simple et
+    déterministe (graine fixe) fait évoluer les voies.
+    """
+
+    def __init__(self, frames=None, seed=0):
+        self.frames = frames
+        self.random = random.Random(seed)
+        self.reads = 0
+        self.fuel = 100.0
+
+    def read_block(self, register, length):
+        self.reads += 1
+        if self.frames:
+            block = list(self.frames[(self.reads - 1) % len(self.frames)])
+        else:
+            jitter = self.random.randint
+            self.fuel = max(0.0, self.fuel - 0.01)
+            rpm = 3000 + jitter(-50, 50)
+            block = [
+                115 + jitter(-1, 1), 115 + jitter(-1, 1), 115 + jitter(-1, 1),  # V1-V3
+                20 + jitter(-1, 1), 20 + jitter(-1, 1), 20 + jitter(-1, 1),  # I1-I3
+                int(self.fuel), 40, rpm >> 8, rpm & 0xFF, 60 + jitter(0, 2),  # FUEL, OIL, RPM, MTEMP
+            ] + [0] * 5
+            block[SEQUENCE_INDEX] = self.reads & 0xFF
+            block[CHECKSUM_INDEX] = frame_checksum(block)
+        return (block + [0] * length)[register:register + length]
+
+
+class SimulatedAVR:
+    """
+    AVR simulé (0x40) : enregistre les commandes reçues.
+    """
+
+    def __init__(self):
+        self.received = []
+
+    def write(self, data):
+        self.received.append(list(data))
+
+
+class SimulatedMCU:
+    """
+    MCU simulé (0x42) : mémoire de registres.
+    """
+
+    def __init__(self):
+        self.registers = [0] * 256
+
+    def read_block(self, register, length):
+        return self.registers[register:register + length]
+
+    def write(self, data):
+        register, *values = data
+        self.registers[register:register + len(values)] = values
+
+
+class SimulatedBus:
+    """
+    Bus SMBus simulé répondant sur 0x40, 0x41 et 0x42.
+
+    latency : durée de chaque transaction (secondes) ; nack_rate : probabilité qu'une
+    transaction échoue comme un NACK réel (OSError EREMOTEIO). Tirages déterministes
+    pour une graine donnée.
+    """
+
+    def __init__(self, latency=0.0, nack_rate=0.0, seed=0, sensor=None):
+        self.latency = latency
+        self.nack_rate = nack_rate
+        self.random = random.Random(seed)
+        self.avr = SimulatedAVR()
+        self.sensor = sensor or SimulatedSensor(seed=seed)
+        self.mcu = SimulatedMCU()
+        self.devices = {0x40: self.avr, 0x41: self.sensor, 0x42: self.mcu}
+        self.transactions = 0
+        self.nacks = 0
+        self._lock = threading.Lock()  # Un seul maître sur le bus, comme le vrai
+
+    def add_sensor(self, address, sensor=None):
+        """Ajoute un capteur simulé à une autre adresse (plusieurs unités sur un bus)."""
+        self.devices[address] = sensor or SimulatedSensor(seed=address)
+        return self.devices[address]
+
+    def _transaction(self, address):
+        with self._lock:
+            self.transactions += 1
+            if self.latency:
+                time.sleep(self.latency)
+            if address not in self.devices or self.random.random() < self.nack_rate:
+                self.nacks += 1
+                raise OSError(errno.EREMOTEIO, "Remote I/O error")
+            return self.devices[address]
+
+    def read_i2c_block_data(self, address, register, length):
+        return self._transaction(address).read_block(register, length)
+
+    def write_byte(self, address, value):
+        self._transaction(address).write([value])
+
+    def write_i2c_block_data(self, address, register, data):
+        self._transaction(address).write([register] + list(data))
+
+
+class SimulatedGPIO:
+    """
+    Remplaçant de RPi.GPIO : mêmes appels, appuis de boutons simulés ou scriptés.
+    """
+    BCM = "BCM"
+    IN = "IN"
+    PUD_UP = "PUD_UP"
+    FALLING = "FALLING"
+
+    def __init__(self):
+        self.callbacks = {}  # pin -> (callback, bouncetime en ms)
+        self.edge_listeners = []  # Appelés avec (pin, instant, accepté) pour chaque front, rebonds compris
+        self._last_edge = {}
+        self.ignored_bounces = 0
+
+    def setmode(self, mode):
+        self.mode = mode
+
+    def setup(self, pin, direction, pull_up_down=None):
+        pass
+
+    def add_event_detect(self, pin, edge, callback=None, bouncetime=0):
+        self.callbacks[pin] = (callback, bouncetime)
+
+    def cleanup(self):
+        self.callbacks.clear()
+
+    def press(self, pin):
+        """Front descendant sur pin, avec l'anti-rebond de add_event_detect."""
+        if pin not in self.callbacks:
+            return
+        callback, bouncetime = self.callbacks[pin]
+        now = time.monotonic()
+        last = self._last_edge.get(pin)
+        accepted = last is None or (now - last) * 1000 >= bouncetime
+        for listener in self.edge_listeners:
+            listener(pin, now, accepted)
+        if not accepted:
+            self.ignored_bounces += 1
+            return
+        self._last_edge[pin] = now
+        if callback:
+            callback(pin)
+
+    def run_script(self, presses):
+        """
+        Rejoue des appuis sur un thread, comme le thread d'événements de RPi.GPIO.
+        presses : liste de (délai depuis le début en secondes, pin).
+        """
+        def run():
+            start = time.monotonic()
+            for delay, pin in sorted(presses):
+                time.sleep(max(0.0, start + delay - time.monotonic()))
+                self.press(pin)
+
+        thread = threading.Thread(target=run, name="gpio-script", daemon=True)
+        thread.start()
+        return thread
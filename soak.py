@@ -0,0 +1,212 @@
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+from benchmark import start_virtual_display
+from panel_logging import get_logger
+
+# Samples taken before this fraction of the run are warm-up (caches, first allocations)
+WARMUP = 0.2
+
+
+def rss_bytes():
+    """Current resident set size, or None where /proc is not available."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def count_widgets(widget):
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def simulated_source(nack_rate, seed=0):
+    from i2c_interface import I2CInterface
+    from sim_backend import SimulatedBus, SimulatedGPIO
+
+    return I2CInterface(bus=SimulatedBus(nack_rate=nack_rate, seed=seed), gpio=SimulatedGPIO())
+
+
+# ========================== TARGETS ========================== #
+
+class PipelineTarget:
+    """Acquisition, conditioning, history, metrics and stream listeners, without Tk."""
+
+    def __init__(self, nack_rate):
+        from headless import HeadlessPanel
+        from metrics import PanelMetrics
+        from stream_server import StateBroadcaster
+
+        self.metrics = PanelMetrics()
+        self.stream = StateBroadcaster()
+        self.panel = HeadlessPanel(source=simulated_source(nack_rate), metrics=self.metrics, stream=self.stream)
+
+    def tick(self, i):
+        self.panel.acquisition.acquire_once()
+        self.panel.acquisition.poll()
+        if i % 1000 == 0:
+            self.metrics.registry.render()  # A scrape
+
+    def counts(self):
+        return {}
+
+    def close(self):
+        self.panel.i2c.scheduler.close()
+
+
+class PanelTarget:
+    """The full Tk panel, ticked by hand: one acquisition and one update_display per tick."""
+
+    def __init__(self, nack_rate):
+        import tkinter as tk
+        from control_panel import ControlPanelApp
+        from metrics import PanelMetrics
+        from stream_server import StateBroadcaster
+
+        self.root = tk.Tk()
+        self.metrics = PanelMetrics()
+        self.panel = ControlPanelApp(self.root, source=simulated_source(nack_rate), metrics=self.metrics,
+                                     stream=StateBroadcaster())
+        deadline = time.monotonic() + 30
+        while self.panel.acquisition is None and time.monotonic() < deadline:
+            self.root.update()
+        if self.panel.acquisition is None:
+            raise RuntimeError("Panel did not start")
+        # Drive acquisition and refresh ourselves, as fast as possible
+        self.panel.acquisition.stop()
+        self.panel.refresh.stop()
+
+    def tick(self, i):
+        self.panel.acquisition.acquire_once()
+        self.panel.update_display()
+        if i % 100 == 0:
+            self.panel.on_off_image()
+            self.root.update()  # Let Tk process its own events too
+        else:
+            self.root.update_idletasks()
+
+    def counts(self):
+        return {
+            "canvas_items": len(self.panel.canvas.find_all()),
+            "widgets": count_widgets(self.root),
+        }
+
+    def close(self):
+        self.panel.i2c.scheduler.close()
+        self.root.destroy()
+
+
+# ========================== RUNNER ========================== #
+
+def sample(target, tick):
+    current, _peak = tracemalloc.get_traced_memory()
+    result = {"tick": tick, "traced_bytes": current, "rss_bytes": rss_bytes()}
+    result.update(target.counts())
+    return result
+
+
+def growth(samples, metric, tolerance):
+    """
+    Growth of metric after warm-up: max of the last half minus max of the first half.
+    Returns (growth, limit); counts allow no growth, memory allows a tolerance fraction.
+    """
+    values = [s[metric] for s in samples[int(len(samples) * WARMUP):] if s.get(metric) is not None]
+    if len(values) < 4:
+        return 0, 0
+    half = len(values) // 2
+    baseline = max(values[:half])
+    grown = max(values[half:]) - baseline
+    if metric.endswith("_bytes"):
+        return grown, max(baseline * tolerance, 256 * 1024)
+    return grown, 0
+
+
+def run(target, ticks, samples_count, tolerance, top):
+    tracemalloc.start()
+    every = max(1, ticks // samples_count)
+    warmup_tick = int(ticks * WARMUP)
+    samples = []
+    reference = None
+    start = time.monotonic()
+    for i in range(ticks):
+        target.tick(i)
+        if i % every == 0 or i == ticks - 1:
+            samples.append(sample(target, i))
+        if i == warmup_tick:
+            reference = tracemalloc.take_snapshot()
+    elapsed = time.monotonic() - start
+
+    report = {"ticks": ticks, "elapsed_s": elapsed, "ticks_per_s": ticks / elapsed, "metrics": {}}
+    failed = []
+    for metric in samples[-1]:
+        if metric == "tick":
+            continue
+        grown, limit = growth(samples, metric, tolerance)
+        report["metrics"][metric] = {"first": samples[0][metric], "last": samples[-1][metric],
+                                     "growth_after_warmup": grown, "limit": limit}
+        if grown > limit:
+            failed.append(metric)
+    if reference is not None and top:
+        stats = tracemalloc.take_snapshot().compare_to(reference, "lineno")
+        report["top_growth"] = [str(stat) for stat in stats[:top]]
+    tracemalloc.stop()
+    report["samples"] = samples
+    report["failed"] = failed
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Long-run soak test against the simulated bus")
+    parser.add_argument("--days", type=float, default=1.0, help="Simulated runtime in days (default: 1)")
+    parser.add_argument("--rate", type=float, default=1.0, help="Simulated refresh rate in Hz (default: 1)")
+    parser.add_argument("--samples", type=int, default=50, help="Samples over the run (default: 50)")
+    parser.add_argument("--tolerance", type=float, default=0.05,
+                        help="Allowed memory growth after warm-up, as a fraction (default: 0.05)")
+    parser.add_argument("--nack-rate", type=float, default=0.01, help="Simulated NACK probability (default: 0.01)")
+    parser.add_argument("--no-gui", action="store_true", help="Soak the acquisition pipeline only, without Tk")
+    parser.add_argument("--top", type=int, default=5, help="Allocation sites with the most growth to report")
+    parser.add_argument("--output", help="Write the full report (with every sample) as JSON to this file")
+    args = parser.parse_args()
+    get_logger("soak")  # Configure the panel loggers first, then quieten them
+    logging.getLogger("gpu_panel").setLevel(logging.ERROR)  # Simulated NACKs are expected here
+
+    ticks = int(args.days * 86400 * args.rate)
+    xvfb = None
+    if args.no_gui:
+        target = PipelineTarget(args.nack_rate)
+    else:
+        xvfb = start_virtual_display()
+        try:
+            target = PanelTarget(args.nack_rate)
+        except Exception as e:
+            print(f"Cannot start the panel ({e}); use --no-gui to soak the pipeline only.", file=sys.stderr)
+            if xvfb:
+                xvfb.terminate()
+            return 2
+    try:
+        report = run(target, ticks, args.samples, args.tolerance, args.top)
+    finally:
+        target.close()
+        if xvfb:
+            xvfb.terminate()
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    summary = {key: value for key, value in report.items() if key != "samples"}
+    print(json.dumps(summary, indent=2))
+    for metric in report["failed"]:
+        result = report["metrics"][metric]
+        print(f"UNBOUNDED GROWTH {metric}: +{result['growth_after_warmup']} after warm-up "
+              f"(limit {result['limit']:.0f})", file=sys.stderr)
+    return 1 if report["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,9 @@
-import tkinter as tk
 import math
-import tkinter.font as tkFont
+from needle import build_needle_table, needle_index
 
 class SpeedGauge:
-    def __init__(self, master, max_value=6000, min_angle=0, max_angle=180, num_segments=5,size=(100,80,)):
-        self.master = master
+    def __init__(self, scene, origin=(0, 0), max_value=6000, min_angle=0, max_angle=180, num_segments=5,size=(100,80,)):
+        self.scene = scene
         
         self.max_value = max_value  # Set the maximum value for the gauge
         self.min_angle = min_angle  # Set the minimum angle for the gauge
@@ -13,24 +12,13 @@ class SpeedGauge:
         self.size = size
         self.min_value = 0
 
-        # Canvas setup
-        self.canvas = tk.Canvas(master, width=self.size[0], height=self.size[1], bg="white", highlightthickness=0)
-        self.canvas.grid(row=0, column=0, padx=20, pady=20)
-
-        # Initialize gauge parameters
-        self.center_x, self.center_y, self.radius = self.size[0]//2, self.size[1]//1.5, self.size[1]//2
+        # Initialize gauge parameters (drawn on the panel's scene, inside a size box at origin)
+        self.center_x, self.center_y, self.radius = origin[0] + self.size[0]//2, origin[1] + self.size[1]//1.5, self.size[1]//2
         self.base_radius = 10  # Radius of the circular base
-        
-        # Create font for label
-        self.font = tkFont.Font(family="Helvetica", size=20, weight="bold")
-
-        # Label to display the RPM
-        self.label_var = tk.StringVar()
-        self.label = tk.Label(master, textvariable=self.label_var, font=self.font, bg="white")
-        self.label.place(x=self.center_x, y=self.center_y + 35)  # Initial placement
 
         # Draw gauge
         self.draw_gauge()
+        self.create_needle()
         self.update_gauge(0)
 
     def draw_gauge(self):
@@ -46,54 +34,51 @@ class SpeedGauge:
             inner_radius = self.radius - (width / 2)  # Inner radius based on width
 
             # Draw each segment as an arc
-            self.canvas.create_arc(
+            self.scene.add(
+                "arc",
                 self.center_x - inner_radius, self.center_y - inner_radius,
                 self.center_x + inner_radius, self.center_y + inner_radius,
                 start=start_angle, extent=segment_extent,
-                style="arc", width=width, outline="black", tags="arc")
+                style="arc", width=width, outline="black")
 
         # Labels for "0" and "MAX" (max_value)
-        self.canvas.create_text(
+        self.scene.add(
+            "text",
             self.center_x + 10 + self.radius * math.cos(math.radians(self.max_angle)),
             self.center_y - self.radius * math.sin(math.radians(self.max_angle)),
             text="0", font=("Helvetica", 14, "bold"), fill="black")
         
-        self.canvas.create_text(
+        self.scene.add(
+            "text",
             self.center_x - 5 + self.radius * math.cos(math.radians(0)),
             self.center_y -  self.radius * math.sin(math.radians(0)),
             text="RPM", font=("Helvetica", 14, "bold"), fill="black")
 
         # Draw the circular base of the needle
-        self.canvas.create_oval(self.center_x - self.base_radius, self.center_y - self.base_radius,
-                                self.center_x + self.base_radius, self.center_y + self.base_radius,
-                                fill="black")
-
-    def update_gauge(self, value):
-        # Remove the existing needle
-        self.canvas.delete("needle")
-        
-        # Map value to angle between min_angle and max_angle
-        angle =  ((value - self.min_value) / (self.max_value - self.min_value)) * (self.max_angle - self.min_angle)
+        self.scene.add("oval", self.center_x - self.base_radius, self.center_y - self.base_radius,
+                       self.center_x + self.base_radius, self.center_y + self.base_radius,
+                       fill="black")
 
-        # Calculate the main tip point of the needle
+    def create_needle(self):
+        """Create the needle and the value label once; updates only move or retext them."""
         needle_length = self.radius - 15  # Shorten the needle to avoid touching the arc
-        x_tip = self.center_x + needle_length * math.cos(math.radians(180 - angle))
-        y_tip = self.center_y - needle_length * math.sin(math.radians(180 - angle))
-
-        # Calculate the two base points of the needle triangle
         needle_base_width = 8  # Width of the needle base
-        x_base1 = self.center_x + (needle_base_width / 2) * math.sin(math.radians(180 - angle))
-        y_base1 = self.center_y + (needle_base_width / 2) * math.cos(math.radians(180 - angle))
-        x_base2 = self.center_x - (needle_base_width / 2) * math.sin(math.radians(180 - angle))
-        y_base2 = self.center_y - (needle_base_width / 2) * math.cos(math.radians(180 - angle))
+        self.needle_table = build_needle_table(self.center_x, self.center_y, needle_length, needle_base_width,
+                                               self.max_angle - self.min_angle)
+        self.needle = self.scene.add("polygon", *self.needle_table[0], fill="red", outline="red")
+        # Label to display the RPM, centered under the needle base
+        self.label = self.scene.add("text", self.center_x, self.center_y + 14, text="",
+                                    font=("Helvetica", 14, "bold"), anchor="n")
+        self.value = None
 
-        # Draw the needle as a triangle
-        self.canvas.create_polygon(x_base1, y_base1, x_base2, y_base2, x_tip, y_tip, 
-                                   fill="red", outline="red", tags="needle")
+    def update_gauge(self, value):
+        if value == self.value:
+            return  # Nothing to redraw
+        self.value = value
 
-        # Update label with current RPM
-        self.label_var.set(f"{value} RPM")
+        # Map value to an angle between min_angle and max_angle and move the needle
+        fraction = (value - self.min_value) / (self.max_value - self.min_value)
+        self.scene.move(self.needle, *self.needle_table[needle_index(fraction)])
 
-        # Center the label based on its width
-        label_width = self.font.measure(self.label_var.get())  # Measure the width of the label text
-        self.label.place(x=self.center_x - (label_width // 3), y=self.center_y + 35)  # Adjust x position to center it
+        # Update label with current RPM
+        self.scene.set(self.label, text=f"{value} RPM")
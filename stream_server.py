@@ -0,0 +1,195 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from sensor_snapshot import SensorSnapshot
+
+# Commentaire SSE envoyé sans mise à jour pendant ce délai : détecte les clients partis
+HEARTBEAT = 15.0
+
+VIEWER_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>GPU Panel</title>
+<style>body{font-family:sans-serif}td{padding:4px 12px;border-bottom:1px solid #ccc}</style></head>
+<body><h3>GPU Panel <span id="online"></span></h3><table id="fields"></table>
+<script>
+const state = {};
+function render() {
+  document.getElementById("online").textContent = state.online ? "" : "(capteur hors ligne)";
+  document.getElementById("fields").innerHTML = Object.keys(state).filter(k => k !== "online")
+    .map(k => `<tr><td>${k}</td><td>${state[k]}</td></tr>`).join("");
+}
+const events = new EventSource("events");
+events.addEventListener("snapshot", e => { Object.assign(state, JSON.parse(e.data).fields); render(); });
+events.addEventListener("delta", e => { Object.assign(state, JSON.parse(e.data).fields); render(); });
+</script></body></html>
+"""
+
+
+class _Client:
+    """
+    File d'un lecteur : un seul delta en attente, fusionné tant qu'il n'a pas été envoyé.
+    """
+    __slots__ = ("pending", "seq", "coalesced", "condition", "closed")
+
+    def __init__(self, lock):
+        self.pending = {}
+        self.seq = 0
+        self.coalesced = 0  # Mises à jour fusionnées dans une autre avant envoi
+        self.condition = threading.Condition(lock)
+        self.closed = False
+
+
+class StateBroadcaster:
+    """
+    Diffuse l'état du panneau à un nombre quelconque de lecteurs, par deltas.
+
+    publish() est un listener d'acquisition : il ne fait que calculer les voies modifiées
+    et les fusionner dans la file de chaque lecteur, sans jamais attendre un lecteur. Un
+    lecteur lent reçoit donc un delta fusionné (les dernières valeurs) plutôt que tous les
+    intermédiaires, et aucun lecteur n'ajoute de lecture sur le bus.
+    """
+
+    def __init__(self, online=None):
+        """online : callable optionnel retournant l'état du capteur (I2CInterface.sensor_online)."""
+        self.online = online
+        self.state = {}
+        self.seq = 0
+        self.published = 0
+        self.deltas = 0
+        self._lock = threading.Lock()
+        self._clients = set()
+
+    def publish(self, snapshot):
+        """Listener de publication d'AcquisitionThread."""
+        if snapshot is None:
+            values = {"online": False}
+        else:
+            values = {field: getattr(snapshot, field) for field in SensorSnapshot.FIELDS}
+            values["online"] = self.online() if self.online else True
+        with self._lock:
+            self.published += 1
+            changed = {key: value for key, value in values.items() if self.state.get(key) != value}
+            if not changed:
+                return
+            self.state.update(changed)
+            self.seq += 1
+            self.deltas += 1
+            for client in self._clients:
+                if client.pending:
+                    client.coalesced += 1
+                client.pending.update(changed)
+                client.seq = self.seq
+                client.condition.notify()
+
+    def subscribe(self):
+        """Nouveau lecteur ; retourne (client, état complet, séquence)."""
+        with self._lock:
+            client = _Client(self._lock)
+            client.seq = self.seq
+            self._clients.add(client)
+            return client, dict(self.state), self.seq
+
+    def unsubscribe(self, client):
+        with self._lock:
+            client.closed = True
+            self._clients.discard(client)
+            client.condition.notify()
+
+    def next_delta(self, client, timeout=HEARTBEAT):
+        """
+        Attend le prochain delta du lecteur : (séquence, voies modifiées), ou None au bout de timeout.
+        """
+        with self._lock:
+            if not client.pending and not client.closed:
+                client.condition.wait(timeout)
+            if not client.pending:
+                return None
+            delta, client.pending = client.pending, {}
+            return client.seq, delta
+
+    def snapshot(self):
+        with self._lock:
+            return self.seq, dict(self.state)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "clients": len(self._clients),
+                "published": self.published,
+                "deltas": self.deltas,
+                "coalesced": sum(client.coalesced for client in self._clients),
+            }
+
+
+class StreamServer:
+    """
+    Serveur HTTP des lecteurs distants (Server-Sent Events).
+
+    /events : flux SSE, un événement "snapshot" (état complet) puis des événements "delta"
+    /state : état complet en JSON
+    / : page de visualisation minimale
+    """
+
+    def __init__(self, broadcaster, port=8765, host="0.0.0.0"):
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                path = self.path.split("?")[0]
+                if path == "/events":
+                    self.stream()
+                elif path == "/state":
+                    seq, state = broadcaster.snapshot()
+                    self.send_body(json.dumps({"seq": seq, "fields": state}).encode(), "application/json")
+                elif path == "/":
+                    self.send_body(VIEWER_PAGE.encode(), "text/html; charset=utf-8")
+                else:
+                    self.send_error(404)
+
+            def send_body(self, body, content_type):
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def stream(self):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                self.close_connection = True
+                client, state, seq = broadcaster.subscribe()
+                try:
+                    self.send_event("snapshot", seq, state)
+                    while not client.closed:
+                        delta = broadcaster.next_delta(client)
+                        if delta is None:
+                            self.wfile.write(b": heartbeat\n\n")
+                            self.wfile.flush()
+                        else:
+                            self.send_event("delta", *delta)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # Lecteur parti
+                finally:
+                    broadcaster.unsubscribe(client)
+
+            def send_event(self, event, seq, fields):
+                data = json.dumps({"seq": seq, "fields": fields}, separators=(",", ":"))
+                self.wfile.write(f"id: {seq}\nevent: {event}\ndata: {data}\n\n".encode())
+                self.wfile.flush()
+
+            def log_message(self, *args):
+                pass  # Pas une ligne de console par lecteur
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, name="stream", daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
@@ -0,0 +1,219 @@
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+from array import array
+
+from sensor_snapshot import SensorSnapshot
+
+# Type de stockage par voie : octet non signé, sauf RPM sur 16 bits
+FIELD_TYPES = {field: "B" for field in SensorSnapshot.FIELDS}
+FIELD_TYPES["RPM"] = "H"
+
+# Enregistrement disque : horodatage (secondes epoch) puis les voies dans l'ordre de FIELDS
+RECORD = struct.Struct("<d" + "".join(FIELD_TYPES[f] for f in SensorSnapshot.FIELDS))
+
+# En-tête du fichier : magie, version, taille d'enregistrement, nombre d'enregistrements valides
+HEADER = struct.Struct("<4sHHQ")
+MAGIC = b"GPUL"
+VERSION = 1
+
+
+class TelemetryHistory:
+    """
+    Historique circulaire des voies capteur en tableaux typés, à budget mémoire fixe.
+    """
+
+    def __init__(self, capacity=86400):
+        self.capacity = capacity
+        self.timestamps = array("d", bytes(8 * capacity))
+        self.channels = {field: array(FIELD_TYPES[field], [0]) * capacity for field in SensorSnapshot.FIELDS}
+        self._next = 0
+        self._count = 0
+
+    @classmethod
+    def from_budget(cls, budget_bytes):
+        """Historique dont la capacité tient dans budget_bytes."""
+        return cls(max(1, budget_bytes // cls.sample_size()))
+
+    @staticmethod
+    def sample_size():
+        """Octets occupés par un échantillon."""
+        return 8 + sum(array(t).itemsize for t in FIELD_TYPES.values())
+
+    def __len__(self):
+        return self._count
+
+    def append(self, snapshot, timestamp=None):
+        """Ajoute un instantané (les lectures en échec, None, sont ignorées)."""
+        if snapshot is None:
+            return
+        i = self._next
+        self.timestamps[i] = time.time() if timestamp is None else timestamp
+        for field, values in self.channels.items():
+            values[i] = getattr(snapshot, field)
+        self._next = (i + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def _order(self, last):
+        count = self._count if last is None else min(last, self._count)
+        start = (self._next - count) % self.capacity
+        return [(start + k) % self.capacity for k in range(count)]
+
+    def series(self, field, last=None):
+        """Valeurs de la voie field, de la plus ancienne à la plus récente."""
+        values = self.channels[field]
+        return [values[i] for i in self._order(last)]
+
+    def times(self, last=None):
+        """Horodatages, de la plus ancienne à la plus récente."""
+        return [self.timestamps[i] for i in self._order(last)]
+
+
+class RollingLog:
+    """
+    Journal disque à enregistrements fixes, écrit via mmap et roulé par taille.
+
+    Le fichier est préalloué à max_bytes ; une fois plein, il est renommé en .1 (les
+    anciens en .2, ... jusqu'à keep) et un nouveau fichier est créé.
+
+    Au redémarrage, un journal existant est repris après son dernier enregistrement ;
+    s'il n'est pas relisible (autre format, plus grand que max_bytes), il est roulé.
+    """
+
+    def __init__(self, path, max_bytes=16 * 1024 * 1024, keep=3):
+        self.path = path
+        self.keep = keep
+        self.capacity = max(1, (max_bytes - HEADER.size) // RECORD.size)
+        self._file = None
+        self._map = None
+        count = self._existing_count()
+        if count is None:
+            if os.path.exists(self.path) and os.path.getsize(self.path):
+                self._rotate()
+            self._open()
+        else:
+            self._open(count)
+
+    def _existing_count(self):
+        """Nombre d'enregistrements d'un journal existant qui peut être repris, sinon None."""
+        try:
+            with open(self.path, "rb") as f:
+                magic, _version, record_size, count = HEADER.unpack(f.read(HEADER.size))
+        except (OSError, struct.error):
+            return None
+        if magic != MAGIC or record_size != RECORD.size or count > self.capacity:
+            return None
+        return count
+
+    def _open(self, count=None):
+        """Crée un journal vide, ou reprend le journal existant après count enregistrements."""
+        size = HEADER.size + self.capacity * RECORD.size
+        self._file = open(self.path, "w+b" if count is None else "r+b")
+        self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), size)
+        self.count = count or 0
+        self._write_header()
+
+    def _write_header(self):
+        HEADER.pack_into(self._map, 0, MAGIC, VERSION, RECORD.size, self.count)
+
+    def _roll(self):
+        self.close()
+        self._rotate()
+        self._open()
+
+    def _rotate(self):
+        for i in range(self.keep - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{i}"):
+                os.replace(f"{self.path}.{i}", f"{self.path}.{i + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+    def write(self, timestamp, snapshot):
+        if self.count >= self.capacity:
+            self._roll()
+        offset = HEADER.size + self.count * RECORD.size
+        RECORD.pack_into(self._map, offset, timestamp, *(getattr(snapshot, f) for f in SensorSnapshot.FIELDS))
+        self.count += 1
+        self._write_header()
+
+    def flush(self):
+        self._map.flush()
+
+    def close(self):
+        if self._map is not None:
+            self._map.flush()
+            self._map.close()
+            self._file.close()
+            self._map = None
+
+
+def read_log(path):
+    """Relit un journal : itère sur (horodatage, SensorSnapshot)."""
+    with open(path, "rb") as f:
+        magic, version, record_size, count = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or record_size != RECORD.size:
+            raise ValueError(f"Journal de télémétrie invalide : {path}")
+        for _ in range(count):
+            timestamp, *values = RECORD.unpack(f.read(RECORD.size))
+            yield timestamp, SensorSnapshot(*values)
+
+
+_STOP = object()  # Fin de file pour HistoryWriter.stop
+
+
+class HistoryWriter(threading.Thread):
+    """
+    Alimente l'historique mémoire et le journal disque depuis la boucle d'acquisition.
+
+    submit() ne bloque jamais : l'écriture disque a lieu sur ce thread, et si la file
+    est pleine l'échantillon n'est pas journalisé (compté dans dropped).
+    """
+
+    def __init__(self, history, log=None, maxsize=1024, flush_interval=5.0):
+        super().__init__(name="history-writer", daemon=True)
+        self.history = history
+        self.log = log
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=maxsize)
+
+    def submit(self, snapshot):
+        """Listener d'acquisition : appelé avec chaque instantané (ou None)."""
+        if snapshot is None:
+            return
+        timestamp = time.time()
+        self.history.append(snapshot, timestamp)
+        if self.log is None:
+            return
+        try:
+            self._queue.put_nowait((timestamp, snapshot))
+        except queue.Full:
+            self.dropped += 1
+
+    def stop(self, timeout=5.0):
+        """Écrit les échantillons en attente, puis ferme le journal."""
+        if self.log is None or not self.is_alive():
+            return
+        self._queue.put(_STOP)
+        self.join(timeout)
+
+    def run(self):
+        if self.log is None:
+            return
+        last_flush = time.monotonic()
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                self.log.close()
+                return
+            if item is not None:
+                self.log.write(*item)
+            if time.monotonic() - last_flush >= self.flush_interval:
+                self.log.flush()
+                last_flush = time.monotonic()
@@ -0,0 +1,163 @@
+import json
+import threading
+import time
+
+from acquisition import AcquisitionThread
+from conditioning import SignalConditioner
+from device_health import CircuitBreaker
+from i2c_backends import open_smbus
+from i2c_scheduler import I2CScheduler
+from panel_logging import get_logger
+from sensor_snapshot import FrameDecoder, FrameError, RepeatedFrameError, SensorSnapshot
+
+
+logger = get_logger("units")
+
+
+class UnitConfig:
+    """
+    Un GPU surveillé : nom affiché, bus I2C, adresse du capteur et voies affichées.
+    """
+
+    def __init__(self, name, bus=1, address=0x41, channels=SensorSnapshot.FIELDS):
+        self.name = name
+        self.bus = bus
+        self.address = address
+        self.channels = tuple(channels)
+
+    @classmethod
+    def from_dict(cls, data):
+        address = data.get("address", 0x41)
+        if isinstance(address, str):
+            address = int(address, 0)  # Accepte "0x41"
+        return cls(data["name"], bus=data.get("bus", 1), address=address,
+                   channels=data.get("channels", SensorSnapshot.FIELDS))
+
+
+DEFAULT_UNITS = [UnitConfig("GPU")]
+
+
+def load_units(path):
+    """
+    Lit la liste des unités depuis un fichier JSON :
+    [{"name": "GPU 1", "bus": 1, "address": "0x41", "channels": ["V1", "FUEL", "RPM"]}, ...]
+    Les noms identifient les unités (lignes du tableau) : ils doivent être uniques.
+    """
+    with open(path) as f:
+        units = [UnitConfig.from_dict(entry) for entry in json.load(f)]
+    seen = set()
+    for unit in units:
+        if unit.name in seen:
+            raise ValueError(f"Nom d'unité en double dans {path} : {unit.name}")
+        seen.add(unit.name)
+    return units
+
+
+class UnitSource:
+    """
+    Source d'instantanés d'une unité, lue à travers le planificateur de son bus.
+    """
+
+    def __init__(self, unit, scheduler, decoder=None, breaker=None):
+        self.unit = unit
+        self.scheduler = scheduler
+        self.decoder = decoder or FrameDecoder()
+        self.breaker = breaker or CircuitBreaker()
+        self.snapshot = None
+
+    def read_snapshot(self):
+        if not self.breaker.allow():
+            return None  # Unité hors ligne : les autres unités du bus ne paient pas ses délais
+        try:
+            data = self.scheduler.read_block(self.unit.address, 0, 16)
+            self.snapshot = self.decoder.decode(data, timestamp=time.monotonic())
+        except RepeatedFrameError:
+            self.breaker.record_success()
+            return self.snapshot
+        except (OSError, FrameError) as e:
+            self.breaker.record_failure()
+            logger.warning(f"Erreur lors de la lecture I2C de {self.unit.name}", extra={
+                "event": "i2c_read_error", "address": hex(self.unit.address), "state": self.breaker.state,
+                "error": e})
+            return None
+        self.breaker.record_success()
+        return self.snapshot
+
+
+class BusPoller(threading.Thread):
+    """
+    Interroge à tour de rôle toutes les unités d'un même bus ; chaque bus a son propre
+    poller, donc les bus sont lus en parallèle.
+    """
+
+    def __init__(self, bus_number, acquisitions, period=1.0):
+        super().__init__(name=f"poller-bus{bus_number}", daemon=True)
+        self.bus_number = bus_number
+        self.acquisitions = acquisitions  # AcquisitionThread non démarrés, pilotés par acquire_once
+        self.period = period
+        self._stop_event = threading.Event()
+
+    def run(self):
+        next_time = time.monotonic()
+        while not self._stop_event.is_set():
+            for acquisition in self.acquisitions:
+                acquisition.acquire_once()
+            next_time += self.period
+            delay = next_time - time.monotonic()
+            if delay < 0:
+                next_time = time.monotonic()
+                delay = 0
+            self._stop_event.wait(delay)
+
+    def stop(self):
+        self._stop_event.set()
+
+
+class UnitFleet:
+    """
+    Toutes les unités configurées : un planificateur et un poller par bus, une acquisition
+    (avec conditionnement) par unité.
+
+    Un bus impossible à ouvrir n'empêche pas les autres de démarrer : ses unités ne sont
+    pas interrogées et restent affichées hors ligne.
+    """
+
+    def __init__(self, units, period=1.0, open_bus=open_smbus):
+        self.units = list(units)
+        self.schedulers = {}
+        self.acquisitions = {}
+        self.failed_buses = {}  # bus -> exception levée à l'ouverture
+        by_bus = {}
+        for unit in self.units:
+            if unit.bus in self.failed_buses:
+                self._add_offline(unit, period)
+                continue
+            if unit.bus not in self.schedulers:
+                try:
+                    self.schedulers[unit.bus] = I2CScheduler(open_bus(unit.bus))
+                except Exception as e:
+                    self.failed_buses[unit.bus] = e
+                    names = ", ".join(u.name for u in self.units if u.bus == unit.bus)
+                    logger.error(f"Bus I2C {unit.bus} indisponible, unités hors ligne : {names}",
+                                 extra={"event": "i2c_bus_error", "error": e})
+                    self._add_offline(unit, period)
+                    continue
+            acquisition = AcquisitionThread(UnitSource(unit, self.schedulers[unit.bus]),
+                                            period=period, conditioner=SignalConditioner())
+            self.acquisitions[unit.name] = acquisition
+            by_bus.setdefault(unit.bus, []).append(acquisition)
+        self.pollers = [BusPoller(bus, acquisitions, period) for bus, acquisitions in by_bus.items()]
+
+    def _add_offline(self, unit, period):
+        """Acquisition jamais interrogée, qui publie une lecture impossible : la ligne s'affiche hors ligne."""
+        acquisition = AcquisitionThread(UnitSource(unit, None), period=period)
+        acquisition.publish(None)
+        self.acquisitions[unit.name] = acquisition
+
+    def start(self):
+        for poller in self.pollers:
+            poller.start()
+
+    def stop(self):
+        for poller in self.pollers:
+            poller.stop()
@@ -0,0 +1,50 @@
+_MISSING = object()
+
+
+class ViewModel:
+    """
+    Remembers the last rendered state of every widget and only turns real changes into Tk calls.
+    """
+
+    def __init__(self):
+        self._state = {}
+        self.frame_calls = 0  # Tk calls made in the current frame
+        self.last_frame_calls = 0  # Tk calls made by the last completed frame
+        self.total_calls = 0
+        self.frames = 0
+
+    def begin_frame(self):
+        self.frame_calls = 0
+
+    def end_frame(self):
+        """Close the frame and return how many Tk calls it made."""
+        self.last_frame_calls = self.frame_calls
+        self.total_calls += self.frame_calls
+        self.frames += 1
+        return self.frame_calls
+
+    def _diff(self, key, options):
+        state = self._state.setdefault(key, {})
+        changed = {name: value for name, value in options.items() if state.get(name, _MISSING) != value}
+        state.update(changed)
+        return changed
+
+    def configure(self, widget, **options):
+        """widget.config(...) with only the options that changed."""
+        changed = self._diff(id(widget), options)
+        if changed:
+            widget.config(**changed)
+            self.frame_calls += 1
+
+    def itemconfig(self, canvas, item, **options):
+        """canvas.itemconfig(item, ...) with only the options that changed."""
+        changed = self._diff((id(canvas), item), options)
+        if changed:
+            canvas.itemconfig(item, **changed)
+            self.frame_calls += 1
+
+    def set(self, key, value, apply):
+        """Call apply(value) only when value differs from the last one rendered under key."""
+        if self._diff(key, {"value": value}):
+            apply(value)
+            self.frame_calls += 1